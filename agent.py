@@ -1,51 +1,41 @@
 
 import os
-import shutil
-import subprocess
 import datetime
 import json
 import time
+import asyncio
+import heapq
+import itertools
 from typing import TypedDict, Annotated, List, Union
-from langchain_core.messages import SystemMessage, HumanMessage, AIMessage, BaseMessage, messages_from_dict, messages_to_dict
+from langchain_core.messages import HumanMessage, AIMessage, BaseMessage, messages_from_dict, messages_to_dict
 from langchain_core.tools import tool
+from langchain_core.utils.function_calling import convert_to_openai_tool
 from langgraph.graph import StateGraph, END
 from langgraph.prebuilt import ToolNode
-from langchain_community.tools import BraveSearch, DuckDuckGoSearchRun
-from brain.llm_factory import get_llm
+from brain.llm_factory import get_llm, clear_llm_cache
 from dotenv import load_dotenv
-import json
 
 # Load environment variables
 load_dotenv()
 
 # Constants
-BRAIN_DIR = "brain"
 CONFIG_FILE = "config.json"
 ENV_FILE = ".env"
-AGENTS_FILE = os.path.join(BRAIN_DIR, "AGENTS.md")
-IDENTITY_FILE = os.path.join(BRAIN_DIR, "IDENTITY.md")
-SOUL_FILE = os.path.join(BRAIN_DIR, "SOUL.md")
-USER_FILE = os.path.join(BRAIN_DIR, "USER.md")
 
-# ... (existing imports)
 from brain.memory_manager import (
-    ensure_brain_initialized, 
     read_file_safe,
     build_system_prompt,
     BRAIN_DIR,
-    SOUL_FILE,
     HEARTBEAT_FILE,
     HEARTBEAT_STATE_FILE,
     SCHEDULE_FILE,
     IDENTITY_FILE,
-    load_config
+    load_config,
+    load_json_file,
+    save_json_file,
+    run_io
 )
 
-# ... (existing constants)
-HEARTBEAT_STATE_FILE = os.path.join(BRAIN_DIR, "memory", "heartbeat-state.json")
-
-# ... (existing functions: load_config, read_file_safe, build_system_prompt)
-
 CHAT_HISTORY_FILE = os.path.join(BRAIN_DIR, "chat_history.json")
 
 def load_chat_history() -> List[BaseMessage]:
@@ -88,6 +78,39 @@ def save_chat_history(messages: List[BaseMessage]) -> None:
     except Exception as e:
         print(f"Warning: Failed to save chat history: {e}")
 
+# Tool-bound chat models, keyed by (provider, model, temperature, tool names)
+_BOUND_LLM_CACHE = {}
+
+def _get_bound_llm(provider: str, model: str, temperature: float, tools):
+    """
+    Returns the chat model with `tools` bound, once per
+    (provider, model, temperature, tool set) instead of on every turn.
+    Binds the schemas pre-parsed at import (_TOOL_SCHEMAS).
+    """
+    key = (provider, model, temperature, tuple(t.name for t in tools))
+    llm_with_tools = _BOUND_LLM_CACHE.get(key)
+    if llm_with_tools is None:
+        schemas = [_TOOL_SCHEMAS[t.name] for t in tools]
+        llm_with_tools = get_llm(provider, model, temperature=temperature).bind_tools(schemas)
+        _BOUND_LLM_CACHE[key] = llm_with_tools
+    return llm_with_tools
+
+def reload_llm():
+    """Drops cached chat models so the next turn picks up new API keys or settings."""
+    clear_llm_cache()
+    _BOUND_LLM_CACHE.clear()
+
+# Recurrence aliases and unit suffixes (in seconds) for parse_recurrence
+_ALIASES = {
+    "daily": datetime.timedelta(days=1),
+    "weekly": datetime.timedelta(weeks=1),
+    "hourly": datetime.timedelta(hours=1),
+}
+_UNIT_SEC = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+# Recurrences stepped in local wall-clock time rather than elapsed seconds
+_CALENDAR_UNITS = ("d", "w")
+_CALENDAR_ALIASES = frozenset(("daily", "weekly"))
+
 def parse_recurrence(recurrence: str) -> datetime.timedelta:
     """
     Parses a recurrence string into a timedelta.
@@ -97,103 +120,195 @@ def parse_recurrence(recurrence: str) -> datetime.timedelta:
     recurrence = recurrence.lower().strip()
     
     # Aliases
-    if recurrence == "daily": return datetime.timedelta(days=1)
-    if recurrence == "weekly": return datetime.timedelta(weeks=1)
-    if recurrence == "hourly": return datetime.timedelta(hours=1)
+    hit = _ALIASES.get(recurrence)
+    if hit is not None:
+        return hit
     
     # Unit parsing
     try:
-        if recurrence.endswith("s"):
-            return datetime.timedelta(seconds=int(recurrence[:-1]))
-        if recurrence.endswith("m"):
-            return datetime.timedelta(minutes=int(recurrence[:-1]))
-        if recurrence.endswith("h"):
-            return datetime.timedelta(hours=int(recurrence[:-1]))
-        if recurrence.endswith("d"):
-            return datetime.timedelta(days=int(recurrence[:-1]))
-        if recurrence.endswith("w"):
-            return datetime.timedelta(weeks=int(recurrence[:-1]))
-    except ValueError:
-        pass
-        
-    return None
-
-def run_autonomous_heartbeat(force: bool = False) -> Union[str, None]:
+        return datetime.timedelta(seconds=int(recurrence[:-1]) * _UNIT_SEC[recurrence[-1]])
+    except (KeyError, ValueError, IndexError):
+        return None
+
+# In-memory min-heap of (due_ts, seq, task) mirroring SCHEDULE.json, reloaded on mtime change
+_SCHED = {"key": None, "heap": [], "seq": 0}
+_SCHED_FMT = "%Y-%m-%d %H:%M"
+# Prefix of every due-task notification; run_agent keys the forced-execution override on it
+_SCHED_MARKER = "⏰ **Scheduled Task Due**"
+
+def _task_ts(item: dict) -> int:
+    """Due time of a schedule entry as epoch seconds (entries written before "ts" fall back to "time")."""
+    ts = item.get("ts")
+    if ts is None:
+        ts = item["ts"] = int(datetime.datetime.strptime(item["time"], _SCHED_FMT).timestamp())
+    return ts
+
+def _stat_key(st: os.stat_result) -> tuple:
+    """Identity of a SCHEDULE.json version: atomic rewrites change the inode even within one mtime tick."""
+    return (st.st_mtime_ns, st.st_ino, st.st_size)
+
+def _next_occurrence(due_ts: int, now_ts: int, recurrence: str, delta: datetime.timedelta) -> int:
     """
-    Checks if a heartbeat is needed. If so, runs background tasks.
-    Also checks schedule for due tasks.
+    First occurrence of a recurring task after now_ts, as epoch seconds.
+    Day/week recurrences step in local wall-clock time, so a daily 09:00 task stays at
+    09:00 across DST changes; s/m/h recurrences step in plain elapsed seconds.
+    """
+    step = max(1, int(delta.total_seconds()))
+    # Whole intervals already missed (DST can make this one short; the loops finish it)
+    missed = max(0, (now_ts - due_ts) // step)
+    recurrence = recurrence.lower().strip()
+    if recurrence not in _CALENDAR_ALIASES and not recurrence.endswith(_CALENDAR_UNITS):
+        return due_ts + step * (missed + 1)
+    # "5d", "1w", "daily", "weekly": naive local datetimes keep the time of day
+    local = datetime.datetime.fromtimestamp(due_ts) + delta * missed
+    ts = int(local.timestamp())
+    while ts <= now_ts:
+        local += delta
+        ts = int(local.timestamp())
+    return ts
+
+def _schedule_heap() -> list:
+    """Returns the schedule heap, re-parsing SCHEDULE.json only if it changed on disk."""
+    try:
+        key = _stat_key(os.stat(SCHEDULE_FILE))
+    except FileNotFoundError:
+        key = None
+    if key != _SCHED["key"] or key is None:
+        schedule = load_json_file(SCHEDULE_FILE, [])
+        heap = [(_task_ts(item), i, item) for i, item in enumerate(schedule)]
+        heapq.heapify(heap)
+        _SCHED["heap"] = heap
+        _SCHED["seq"] = len(heap)
+        _SCHED["key"] = key
+    return _SCHED["heap"]
+
+def _check_schedule() -> List[str]:
+    """
+    Fires due tasks from SCHEDULE.json, rescheduling recurring ones.
+    Returns the notifications for every task that came due.
     """
-    # 1. Check Schedule (Every run)
     schedule_notifications = []
     try:
-        schedule_content = read_file_safe(SCHEDULE_FILE, "[]")
-        schedule = json.loads(schedule_content)
-        
-        current_time_str = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
-        matches = []
-        remaining = []
-        
-        for item in schedule:
-            if item["time"] <= current_time_str:
-                matches.append(item)
-            else:
-                remaining.append(item)
-                
-        if matches:
+        heap = _schedule_heap()
+        now_ts = int(time.time())
+
+        # Nothing due is a single comparison against the earliest task
+        if heap and heap[0][0] <= now_ts:
             # We have due tasks!
             # Propagate specific notifications
-            # Save updated schedule (removing executed tasks, rescheduling recurring ones)
-            new_schedule = list(remaining)
-            
-            for task in matches:
+            # Pop every due task first so a short recurrence can't fire twice in one check
+            matches = []
+            while heap and heap[0][0] <= now_ts:
+                matches.append(heapq.heappop(heap))
+
+            for due_ts, _, task in matches:
                 # notification
                 recurrence = task.get("recurrence")
                 if recurrence:
                     # Calculate next time
                     try:
-                        fmt = "%Y-%m-%d %H:%M"
-                        dt = datetime.datetime.strptime(task["time"], fmt)
-                        
                         delta = parse_recurrence(recurrence)
                         if delta:
-                            dt += delta
-                            # Update task time
-                            task["time"] = dt.strftime(fmt)
-                            new_schedule.append(task)
-                            schedule_notifications.append(f"⏰ **Scheduled Task Due**: {task['task']} (Rescheduled for {task['time']})")
+                            # Update task time: the first occurrence after now, so occurrences
+                            # missed while the daemon was down fire once, not back to back
+                            task["ts"] = _next_occurrence(due_ts, now_ts, recurrence, delta)
+                            task["time"] = time.strftime(_SCHED_FMT, time.localtime(task["ts"]))
+                            heapq.heappush(heap, (task["ts"], _SCHED["seq"], task))
+                            _SCHED["seq"] += 1
+                            schedule_notifications.append(f"{_SCHED_MARKER}: {task['task']} (Rescheduled for {task['time']})")
                         else:
-                            schedule_notifications.append(f"⏰ **Scheduled Task Due**: {task['task']} (Error: Invalid recurrence '{recurrence}')")
+                            schedule_notifications.append(f"{_SCHED_MARKER}: {task['task']} (Error: Invalid recurrence '{recurrence}')")
                     except Exception as e:
-                        schedule_notifications.append(f"⏰ **Scheduled Task Due**: {task['task']} (Error rescheduling: {e})")
+                        schedule_notifications.append(f"{_SCHED_MARKER}: {task['task']} (Error rescheduling: {e})")
                 else:
-                    schedule_notifications.append(f"⏰ **Scheduled Task Due**: {task['task']} (Time: {task['time']})")
-
-            # Sort and save
-            new_schedule.sort(key=lambda x: x["time"])
-            
-            with open(SCHEDULE_FILE, "w") as f:
-                json.dump(new_schedule, f, indent=4)
+                    schedule_notifications.append(f"{_SCHED_MARKER}: {task['task']} (Time: {task['time']})")
+
+            # Save updated schedule (removing executed tasks, rescheduling recurring ones),
+            # still sorted by time on disk for the TUI task list and schedule_task
+            # Our own write shouldn't trigger a re-parse next check. Key on the stat of the
+            # file we wrote, not a later stat of the path, which could already be a newer
+            # schedule_task/cancel_task write that must still be loaded.
+            _SCHED["key"] = _stat_key(
+                save_json_file(SCHEDULE_FILE, [entry[2] for entry in sorted(heap)])
+            )
     except Exception as e:
+        # Force a reload next time rather than trusting a half-updated heap
+        _SCHED["key"] = None
         schedule_notifications.append(f"Scheduler Error: {e}")
 
-    # 2. Check Autonomous Interval (Every 3 hours)
-    last_run = 0
-    if os.path.exists(HEARTBEAT_STATE_FILE):
-        try:
-            with open(HEARTBEAT_STATE_FILE, "r") as f:
-                data = json.load(f)
-                last_run = data.get("last_run", 0) or 0
-        except: pass
-    
+    return schedule_notifications
+
+def seconds_until_next_task(limit: float) -> float:
+    """
+    Seconds until the earliest scheduled task comes due, between 1 (so a task that
+    keeps failing to save can't spin the loop) and limit. Re-reads SCHEDULE.json
+    only if it changed on disk.
+    """
+    try:
+        heap = _schedule_heap()
+    except Exception:
+        return limit  # _check_schedule reports schedule errors
+    if not heap:
+        return limit
+    return min(limit, max(1.0, heap[0][0] - time.time()))
+
+def _flatten_content(content) -> str:
+    """Flattens message content (a string, or a list of text/dict parts) into plain text."""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        # Extract text from parts if it's a list of dicts
+        return " ".join(p["text"] if isinstance(p, dict) and "text" in p else str(p) for p in content)
+    return str(content)
+
+# Last heartbeat run, mirrored from HEARTBEAT_STATE_FILE and re-read only when its mtime changes
+_HB_STATE = {"mtime": None, "last_run": 0.0}
+
+def _heartbeat_last_run() -> float:
+    """Returns the last heartbeat run time (epoch seconds), 0 if unknown or unreadable."""
+    try:
+        st = os.stat(HEARTBEAT_STATE_FILE)
+    except FileNotFoundError:
+        st = None
+    mtime = st.st_mtime_ns if st else None
+    if mtime != _HB_STATE["mtime"]:
+        last_run = 0.0
+        # Empty or truncated ("{}") state can't hold a last_run, so skip the parse
+        if st and st.st_size > 2:
+            try:
+                last_run = float(load_json_file(HEARTBEAT_STATE_FILE, {}).get("last_run", 0) or 0)
+            except (OSError, ValueError, TypeError, AttributeError):
+                # Corrupt or unreadable state: treat the heartbeat as due
+                last_run = 0.0
+        _HB_STATE["mtime"] = mtime
+        _HB_STATE["last_run"] = last_run
+    return _HB_STATE["last_run"]
+
+def _write_heartbeat_state(now: float) -> None:
+    """Records a successful heartbeat run at `now` (epoch seconds)."""
+    save_json_file(HEARTBEAT_STATE_FILE, {"last_run": now, "status": "ok"})
+    _HB_STATE["mtime"] = os.stat(HEARTBEAT_STATE_FILE).st_mtime_ns
+    _HB_STATE["last_run"] = now
+
+async def _check_heartbeat(force: bool = False) -> Union[str, None]:
+    """
+    Runs the autonomous heartbeat check if it is due (every 3 hours).
+    Returns the heartbeat message for the user, if any.
+    """
     now = time.time()
     heartbeat_msg = None
+
+    # 3 hours = 10800 seconds. A recent cached run means not due: skip touching the state file.
+    if not force and now - _HB_STATE["last_run"] < 10800:
+        return None
     
-    # 3 hours = 10800 seconds
-    if force or (now - last_run >= 10800):
+    if force or (now - await run_io(_heartbeat_last_run) >= 10800):
         # Run standard heartbeat check
         try:
-            heartbeat_instructions = read_file_safe(HEARTBEAT_FILE, "Report status.")
-            identity = read_file_safe(IDENTITY_FILE)
+            heartbeat_instructions, identity = await asyncio.gather(
+                run_io(read_file_safe, HEARTBEAT_FILE, "Report status."),
+                run_io(read_file_safe, IDENTITY_FILE),
+            )
             
             prompt = f"""
             [SYSTEM WAKEUP - AUTONOMOUS HEARTBEAT]
@@ -213,27 +328,15 @@ def run_autonomous_heartbeat(force: bool = False) -> Union[str, None]:
             
             config = load_config()
             llm = get_llm(config["provider"], config["model"], temperature=0.3)
-            res = llm.invoke(prompt)
+            res = await llm.ainvoke(prompt)
             # Handle list return from invoke (rare but possible)
             if isinstance(res, list):
                 res = res[0]
             
-            content = res.content
-            if isinstance(content, list):
-                # Extract text from parts if it's a list of dicts
-                parts = []
-                for p in content:
-                    if isinstance(p, dict) and "text" in p:
-                        parts.append(p["text"])
-                    else:
-                        parts.append(str(p))
-                content = " ".join(parts)
-            
-            response = str(content).strip()
+            response = _flatten_content(res.content).strip()
             
             # Update state file
-            with open(HEARTBEAT_STATE_FILE, "w") as f:
-                json.dump({"last_run": now, "status": "ok"}, f)
+            await run_io(_write_heartbeat_state, now)
 
             if "Status: OK" in response:
                 # Remove "Status: OK" to see if there are other instructions
@@ -245,6 +348,19 @@ def run_autonomous_heartbeat(force: bool = False) -> Union[str, None]:
         except Exception as e:
             heartbeat_msg = f"Heartbeat Error: {str(e)}"
 
+    return heartbeat_msg
+
+async def run_autonomous_heartbeat(force: bool = False) -> Union[str, None]:
+    """
+    Checks if a heartbeat is needed. If so, runs background tasks.
+    Also checks schedule for due tasks.
+    """
+    # Schedule file I/O (every run) overlaps with the heartbeat LLM call (every 3 hours)
+    schedule_notifications, heartbeat_msg = await asyncio.gather(
+        run_io(_check_schedule),
+        _check_heartbeat(force),
+    )
+
     # Combine results
     results = []
     if schedule_notifications:
@@ -268,7 +384,6 @@ from tools.system import (
 from tools.scheduler import schedule_task, cancel_task
 from tools.search import web_search
 from tools.skills.openweather import get_current_weather
-from tools.skills.openweather import get_current_weather
 # OpenClaw-style unified browser tool
 from tools.skills.browser.browser import browser_act
 # GitHub autonomous actions
@@ -297,6 +412,65 @@ import platform
 if platform.system() == "Darwin":
     from tools.skills.macos.macos_control import macos_act
 
+# Define the tools the agent can use
+# We catch the SystemExit to prevent the agent from killing the whole process
+@tool 
+def exit_conversation():
+    """
+    Ends the current conversation.
+    """
+    return "Goodbye!"
+
+# Every tool the graph can execute. Schemas are parsed once here and shared by
+# run_agent (bind_tools) and build_graph (ToolNode) instead of per turn/build.
+ALL_TOOLS = (
+    reflect_and_evolve, update_memory, update_user_profile, execute_terminal_command, 
+    schedule_task, cancel_task, web_search, get_current_weather, 
+    browser_act, github_act, stripe_act, discord_act, jira_act,
+    get_secret, set_secret, list_secrets, initialize_local_vault, unlock_local_vault, lock_local_vault,
+    read_file, write_file, list_directory, 
+    exit_conversation, send_telegram_message,
+    gmail_act, drive_act, docs_act, sheets_act, calendar_act, wallet_act,
+    paypal_act,
+)
+# Add macOS tool only on macOS
+if platform.system() == "Darwin":
+    ALL_TOOLS += (macos_act,)
+
+# Skill (config.json "skills" key) that gates each optional tool; the rest are always bound
+_TOOL_SKILLS = {
+    get_current_weather.name: "openweather",
+    browser_act.name: "browser",
+    github_act.name: "github",
+    stripe_act.name: "stripe",
+    discord_act.name: "discord",
+    jira_act.name: "jira",
+    gmail_act.name: "google",
+    drive_act.name: "google",
+    docs_act.name: "google",
+    sheets_act.name: "google",
+    calendar_act.name: "google",
+    wallet_act.name: "google",
+    paypal_act.name: "paypal",
+}
+if platform.system() == "Darwin":
+    _TOOL_SKILLS[macos_act.name] = "macos"
+# Registered with the ToolNode but never offered to the model
+_UNBOUND_TOOLS = frozenset((exit_conversation.name,))
+
+def _select_tools(skills_config: dict) -> tuple:
+    """Returns the tools to bind for a turn: the core tools plus those of every enabled skill."""
+    enabled = {name for name, cfg in skills_config.items() if cfg.get("enabled", False)}
+    selected = []
+    for t in ALL_TOOLS:
+        skill = _TOOL_SKILLS.get(t.name)
+        if t.name not in _UNBOUND_TOOLS and (skill is None or skill in enabled):
+            selected.append(t)
+    return tuple(selected)
+
+_TOOL_SCHEMAS = {t.name: convert_to_openai_tool(t) for t in ALL_TOOLS}
+_TOOL_NODE = ToolNode(list(ALL_TOOLS))
+
 
 # --- Graph ---
 
@@ -332,86 +506,58 @@ def _trim_messages(messages: list, max_messages: int = 24, max_tool_chars: int =
     return messages
 
 
-def run_agent(state: AgentState):
-    system_prompt = build_system_prompt()
-    chat_history = list(state["messages"])
+async def run_agent(
+    state: AgentState,
+    *,
+    _build_prompt=build_system_prompt,
+    _load_config=load_config,
+    _select=_select_tools,
+    _bind=_get_bound_llm,
+):
+    # Hot-path helpers are bound as defaults when the graph is built (local lookups per turn).
+    # They still run every turn: config.json and API keys can change from the TUI mid-session,
+    # and each one is cached internally (prompt files and config by mtime, bindings by tool set).
+    system_prompt = _build_prompt()
+    history = state["messages"]
     
     # Sanitization: Ensure AIMessages with tool calls have content (fix for google-genai SDK)
-    for msg in chat_history:
-        if isinstance(msg, AIMessage) and msg.tool_calls and not msg.content:
+    # Our own responses are sanitized below when they are produced, so only the newest
+    # messages can need it: walk backwards and stop at the first already-sanitized one.
+    for msg in reversed(history):
+        if msg.type == "ai" and msg.tool_calls:
+            if msg.content:
+                break
             msg.content = " "
             
     # Robust Fix: Merge system prompt into the first HumanMessage
     # This avoids "contents required" errors and order issues with Gemini 2.0
-    content = str(chat_history[0].content)
+    first = history[0]
+    content = first.content if isinstance(first.content, str) else str(first.content)
     
     # FORCE EXECUTION for Scheduled Tasks
-    if "⏰ **Scheduled Task Due**" in content:
+    # Heartbeat results list schedule notifications first, so the marker is always a prefix
+    if content.startswith(_SCHED_MARKER):
         content = f"⚠️ SYSTEM OVERRIDE: IMMEDIATELY EXECUTE THE FOLLOWING SCHEDULED TASKS. DO NOT CHAT. USE TOOLS.\n\n{content}"
 
-    if chat_history and isinstance(chat_history[0], HumanMessage):
-        chat_history[0] = HumanMessage(content=system_prompt + "\n\n" + content)
+    merged = HumanMessage(content=system_prompt + "\n\n" + content)
+    # One new list for the LLM call; the graph state's list is never copied or modified
+    if isinstance(first, HumanMessage):
+        messages = [merged, *itertools.islice(history, 1, None)]
     else:
         # Fallback if first message isn't Human
-        chat_history = [HumanMessage(content=system_prompt + "\n\n" + content)] + chat_history
+        messages = [merged, *history]
     
     # Trim history to prevent token overflow during long browser sessions
-    chat_history = _trim_messages(chat_history)
-    
-    messages = chat_history
-    
-    config = load_config()
-    llm = get_llm(config["provider"], config["model"], temperature=0)
-
-    tools = [reflect_and_evolve, update_memory, update_user_profile, execute_terminal_command, schedule_task, cancel_task, web_search]
+    messages = _trim_messages(messages)
     
-    # Dynamic Skills
-    skills_config = config.get("skills", {})
+    config = _load_config()
 
-    if skills_config.get("openweather", {}).get("enabled", False):
-        tools.append(get_current_weather)
+    # Core tools plus the dynamic skills enabled in config.json
+    tools = _select(config.get("skills", {}))
 
-    if skills_config.get("browser", {}).get("enabled", False):
-        # OpenClaw-style unified browser tool
-        tools.append(browser_act)
+    llm_with_tools = _bind(config["provider"], config["model"], 0, tools)
 
-    if skills_config.get("github", {}).get("enabled", False):
-        # GitHub action module
-        tools.append(github_act)
-
-    if skills_config.get("stripe", {}).get("enabled", False):
-        # Stripe payment module
-        tools.append(stripe_act)
-
-    if skills_config.get("discord", {}).get("enabled", False):
-        # Discord bot module
-        tools.append(discord_act)
-
-    if skills_config.get("jira", {}).get("enabled", False):
-        # Jira action module
-        tools.append(jira_act)
-
-    # File tools are always available
-    tools.extend([read_file, write_file, list_directory])
-    
-    # Vault Tools (Always available for memory management)
-    tools.extend([get_secret, set_secret, list_secrets, initialize_local_vault, unlock_local_vault, lock_local_vault])
-    
-    # Telegram tool
-    tools.append(send_telegram_message)
-
-    if skills_config.get("google", {}).get("enabled", False):
-        tools.extend([gmail_act, drive_act, docs_act, sheets_act, calendar_act, wallet_act])
-
-    if skills_config.get("macos", {}).get("enabled", False) and platform.system() == "Darwin":
-        tools.append(macos_act)
-
-    if skills_config.get("paypal", {}).get("enabled", False):
-        tools.append(paypal_act)
-
-    llm_with_tools = llm.bind_tools(tools)
-
-    response = llm_with_tools.invoke(messages)
+    response = await llm_with_tools.ainvoke(messages)
     
     # ── GUARD: Empty response after tool use ──────────────────────────────────
     # This happens when snapshot content is large (emails, Amazon results) — the 
@@ -435,7 +581,7 @@ def run_agent(state: AgentState):
         try:
             # Use a plain LLM (no tools) to force a text-only response
             plain_llm = get_llm(config["provider"], config["model"], temperature=0)
-            summary_response = plain_llm.invoke(summary_messages)
+            summary_response = await plain_llm.ainvoke(summary_messages)
             # Use the summary as the actual response
             summary_text = summary_response.content
             if isinstance(summary_text, list):
@@ -453,37 +599,12 @@ def run_agent(state: AgentState):
         
     return {"messages": [response]}
 
-# Define the tools the agent can use
-# We catch the SystemExit to prevent the agent from killing the whole process
-@tool 
-def exit_conversation():
-    """
-    Ends the current conversation.
-    """
-    return "Goodbye!"
-
 def build_graph():
     workflow = StateGraph(AgentState)
     workflow.add_node("agent", run_agent)
-    # Note: ToolNode must have *all* potential tools registered, OR we need to dynamically build it?
-    # ToolNode documentation says it executes tools called by the LLM.
+    # Note: ToolNode must have *all* potential tools registered.
     # Providing all tools safely is fine, as the LLM won't call them if not bound.
-    # However, to be strict, we can just expose all.
-    tools = [
-        reflect_and_evolve, update_memory, update_user_profile, execute_terminal_command, 
-        schedule_task, cancel_task, web_search, get_current_weather, 
-        browser_act, github_act, stripe_act, discord_act, jira_act,
-        get_secret, set_secret, list_secrets, initialize_local_vault, unlock_local_vault, lock_local_vault,
-        read_file, write_file, list_directory, 
-        exit_conversation, send_telegram_message,
-        gmail_act, drive_act, docs_act, sheets_act, calendar_act, wallet_act,
-        paypal_act,
-    ]
-    # Add macOS tool only on macOS
-    if platform.system() == "Darwin":
-        tools.append(macos_act)
-    tool_node = ToolNode(tools)
-    workflow.add_node("tools", tool_node)
+    workflow.add_node("tools", _TOOL_NODE)
 
     workflow.set_entry_point("agent")
 
@@ -1,109 +1,134 @@
 import os
+import hashlib
+import functools
+import importlib
 from typing import Optional
 from brain.provider_models import PROVIDERS
 
+# Provider ids for the unknown-provider error message
+_SUPPORTED = ", ".join(PROVIDERS.keys())
+
+# Chat model clients keyed by (provider, model, temperature, API key hash), so repeated
+# get_llm calls reuse one client (and its HTTP connection pool) per configuration
+_LLM_CACHE = {}
+
+def _key_hash(api_key: Optional[str]) -> Optional[str]:
+    """Digest of the API key for use in cache keys, so the plaintext key is never one."""
+    if not api_key:
+        return None
+    return hashlib.blake2b(api_key.encode("utf-8"), digest_size=16).hexdigest()
+
+# API keys read from the environment, keyed by env var name. Only found keys are
+# cached, so a key set later (setup wizard, TUI config) is still picked up.
+_ENV_KEYS = {}
+
+def _env_key(env_var: Optional[str]) -> Optional[str]:
+    """Returns the API key in env_var, reading os.environ only until it is first found."""
+    if not env_var:
+        return None  # e.g. Ollama needs no key
+    key = _ENV_KEYS.get(env_var)
+    if key is None:
+        key = os.getenv(env_var)
+        if key:
+            _ENV_KEYS[env_var] = key
+    return key
+
+def clear_llm_cache() -> None:
+    """Drops cached clients and env keys, e.g. after API keys or settings change."""
+    _LLM_CACHE.clear()
+    _ENV_KEYS.clear()
+
 def get_llm(provider: str, model_name: str, temperature: float = 0.7, api_key: Optional[str] = None):
     """
     Returns a LangChain chat model instance based on the provider.
+    Instances are cached per (provider, model, temperature, API key).
     """
     provider = provider.lower().strip()
-    
-    # 1. GOOGLE
-    if provider == "google":
-        try:
-            from langchain_google_genai import ChatGoogleGenerativeAI, HarmBlockThreshold, HarmCategory
-        except ImportError:
-            raise ImportError("Please install langchain-google-genai to use Google models.")
-            
-        return ChatGoogleGenerativeAI(
-            model=model_name, 
-            temperature=temperature, 
-            google_api_key=api_key or os.environ.get("GOOGLE_API_KEY"),
-            safety_settings={
-                HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
-                HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
-                HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
-                HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
-            }
-        )
-        
-    # 2. OPENAI
-    elif provider == "openai":
-        try:
-            from langchain_openai import ChatOpenAI
-        except ImportError:
-            raise ImportError("Please install langchain-openai to use OpenAI models.")
-            
-        return ChatOpenAI(
-            model=model_name, 
-            temperature=temperature, 
-            api_key=api_key or os.environ.get("OPENAI_API_KEY")
-        )
-        
-    # 3. ANTHROPIC
-    elif provider == "anthropic":
-        try:
-            from langchain_anthropic import ChatAnthropic
-        except ImportError:
-            raise ImportError("Please install langchain-anthropic to use Anthropic models.")
-            
-        return ChatAnthropic(
-            model=model_name, 
-            temperature=temperature, 
-            api_key=api_key or os.environ.get("ANTHROPIC_API_KEY")
-        )
-
-    # 4. GROQ
-    elif provider == "groq":
-        try:
-            from langchain_groq import ChatGroq
-        except ImportError:
-            raise ImportError("Please install langchain-groq to use Groq models.")
-            
-        return ChatGroq(
-            model=model_name,
-            temperature=temperature,
-            api_key=api_key or os.environ.get("GROQ_API_KEY")
-        )
-
-    # 5. MISTRAL
-    elif provider == "mistral":
-        try:
-            from langchain_mistralai import ChatMistralAI
-        except ImportError:
-            raise ImportError("Please install langchain-mistralai to use Mistral models.")
-            
-        return ChatMistralAI(
-            model=model_name,
-            temperature=temperature,
-            api_key=api_key or os.environ.get("MISTRAL_API_KEY")
-        )
-
-    # 6. OLLAMA
-    elif provider == "ollama":
-        try:
-            from langchain_ollama import ChatOllama
-        except ImportError:
-            raise ImportError("Please install langchain-ollama to use Ollama models.")
-            
-        return ChatOllama(
-            model=model_name,
-            temperature=temperature
-        )
-        
-    # 7. XAI
-    elif provider == "xai":
-        try:
-            from langchain_xai import ChatXAI
-        except ImportError:
-            raise ImportError("Please install langchain-xai to use xAI models.")
-        
-        return ChatXAI(
-            model=model_name,
-            temperature=temperature,
-            xai_api_key=api_key or os.environ.get("XAI_API_KEY")
-        )
-        
-    else:
-        supported = ", ".join(PROVIDERS.keys())
-        raise ValueError(f"Unknown provider: {provider}. Supported: {supported}.")
+    builder = _DISPATCH.get(provider)
+    if builder is None:
+        raise ValueError(f"Unknown provider: {provider}. Supported: {_SUPPORTED}.")
+    if not api_key:
+        api_key = _env_key(PROVIDERS[provider]["env_var"])
+
+    cache_key = (provider, model_name, temperature, _key_hash(api_key))
+    llm = _LLM_CACHE.get(cache_key)
+    if llm is None:
+        llm = builder(model_name, temperature, api_key)
+        _LLM_CACHE[cache_key] = llm
+    return llm
+
+# Chat model class per provider as (module, class, pip package, label),
+# imported on first use so only the selected provider's package is ever loaded
+_CHAT_CLASSES = {
+    "google": ("langchain_google_genai", "ChatGoogleGenerativeAI", "langchain-google-genai", "Google"),
+    "openai": ("langchain_openai", "ChatOpenAI", "langchain-openai", "OpenAI"),
+    "anthropic": ("langchain_anthropic", "ChatAnthropic", "langchain-anthropic", "Anthropic"),
+    "groq": ("langchain_groq", "ChatGroq", "langchain-groq", "Groq"),
+    "mistral": ("langchain_mistralai", "ChatMistralAI", "langchain-mistralai", "Mistral"),
+    "ollama": ("langchain_ollama", "ChatOllama", "langchain-ollama", "Ollama"),
+    "xai": ("langchain_xai", "ChatXAI", "langchain-xai", "xAI"),
+}
+
+@functools.lru_cache(maxsize=None)
+def _chat_class(provider: str):
+    """Imports and returns the chat model class for provider (once; failures aren't cached)."""
+    module_name, class_name, package, label = _CHAT_CLASSES[provider]
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        raise ImportError(f"Please install {package} to use {label} models.")
+    return getattr(module, class_name)
+
+@functools.lru_cache(maxsize=1)
+def _google_safety_settings() -> dict:
+    """
+    Gemini safety settings (all categories BLOCK_NONE), built once on first Google use.
+    Shared across clients; pydantic copies it into each model, so it's never mutated.
+    """
+    _chat_class("google")  # Raises the install hint if langchain-google-genai is missing
+    from langchain_google_genai import HarmBlockThreshold, HarmCategory
+    return {
+        HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
+        HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
+        HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
+        HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
+    }
+
+# Per-provider constructors. get_llm has already resolved api_key (argument or env var).
+def _build_google(model_name: str, temperature: float, api_key: Optional[str]):
+    return _chat_class("google")(
+        model=model_name, 
+        temperature=temperature, 
+        google_api_key=api_key,
+        safety_settings=_google_safety_settings()
+    )
+
+def _build_openai(model_name: str, temperature: float, api_key: Optional[str]):
+    return _chat_class("openai")(model=model_name, temperature=temperature, api_key=api_key)
+
+def _build_anthropic(model_name: str, temperature: float, api_key: Optional[str]):
+    return _chat_class("anthropic")(model=model_name, temperature=temperature, api_key=api_key)
+
+def _build_groq(model_name: str, temperature: float, api_key: Optional[str]):
+    return _chat_class("groq")(model=model_name, temperature=temperature, api_key=api_key)
+
+def _build_mistral(model_name: str, temperature: float, api_key: Optional[str]):
+    return _chat_class("mistral")(model=model_name, temperature=temperature, api_key=api_key)
+
+def _build_ollama(model_name: str, temperature: float, api_key: Optional[str]):
+    # Ollama runs locally without an API key
+    return _chat_class("ollama")(model=model_name, temperature=temperature)
+
+def _build_xai(model_name: str, temperature: float, api_key: Optional[str]):
+    return _chat_class("xai")(model=model_name, temperature=temperature, xai_api_key=api_key)
+
+# Provider id -> constructor: a single dict lookup instead of an if/elif chain
+_DISPATCH = {
+    "google": _build_google,
+    "openai": _build_openai,
+    "anthropic": _build_anthropic,
+    "groq": _build_groq,
+    "mistral": _build_mistral,
+    "ollama": _build_ollama,
+    "xai": _build_xai,
+}
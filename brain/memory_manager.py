@@ -1,8 +1,19 @@
 
 import os
 import shutil
+import platform
 import datetime
 import json
+import functools
+import tempfile
+import mmap
+import asyncio
+import concurrent.futures
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Constants
 BRAIN_DIR = "brain"
@@ -322,102 +333,300 @@ Then, **DELETE THIS FILE** (`brain/BOOTSTRAP.md`) to complete the onboarding pro
 """
 
 
+# Default brain files, stripped and UTF-8 encoded once at import
+_DEFAULTS = tuple((path, content.strip().encode("utf-8")) for path, content in (
+    (IDENTITY_FILE, DEFAULT_IDENTITY),
+    (HEARTBEAT_FILE, DEFAULT_HEARTBEAT),
+    (USER_FILE, DEFAULT_USER),
+    (AGENTS_FILE, DEFAULT_AGENTS),
+    (TOOLS_FILE, DEFAULT_TOOLS),
+    (SOUL_FILE, DEFAULT_SOUL),
+    (SHIELD_FILE, DEFAULT_SHIELD),
+    (MEMORY_FILE, DEFAULT_MEMORY),
+    (SCHEDULE_FILE, "[]"),  # Empty list for schedule
+))
+_DEFAULT_BOOTSTRAP_BYTES = DEFAULT_BOOTSTRAP.strip().encode("utf-8")
+
+# Mode for files we create, honouring the umask like a plain open() would (mkstemp
+# always creates 0o600). os.umask can only be read by setting it, so read it once here.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_FILE_MODE = 0o666 & ~_UMASK
+
 def ensure_brain_initialized():
     """Ensures all brain files exist with default content."""
-    os.makedirs(BRAIN_DIR, exist_ok=True)
     os.makedirs(MEMORY_DIR, exist_ok=True)
     
-    files = [
-        (IDENTITY_FILE, DEFAULT_IDENTITY),
-        (HEARTBEAT_FILE, DEFAULT_HEARTBEAT),
-        (USER_FILE, DEFAULT_USER),
-        (AGENTS_FILE, DEFAULT_AGENTS),
-        (TOOLS_FILE, DEFAULT_TOOLS),
-        (SOUL_FILE, DEFAULT_SOUL),
-        (SHIELD_FILE, DEFAULT_SHIELD),
-        (MEMORY_FILE, DEFAULT_MEMORY),
-        (SCHEDULE_FILE, "[]")  # Empty list for schedule
-    ]
-    
+    # One directory read instead of an exists() stat per file
+    with os.scandir(BRAIN_DIR) as entries:
+        existing = {entry.name for entry in entries}
+
+    files = list(_DEFAULTS)
     # Only create BOOTSTRAP.md if AGENTS.md is missing (Fresh Install)
-    if not os.path.exists(AGENTS_FILE):
-        files.append((BOOTSTRAP_FILE, DEFAULT_BOOTSTRAP))
+    if os.path.basename(AGENTS_FILE) not in existing:
+        files.append((BOOTSTRAP_FILE, _DEFAULT_BOOTSTRAP_BYTES))
     
-    for filepath, content in files:
-        if not os.path.exists(filepath):
-            with open(filepath, "w") as f:
-                f.write(content.strip())
+    for filepath, data in files:
+        if os.path.basename(filepath) in existing:
+            continue
+        # Written to a temp file, then published with link(): atomic (a crash never leaves
+        # an empty or torn file that later runs would take as initialized) and exclusive
+        # like O_EXCL (a file another process created since the scan is left alone)
+        fd, tmp_path = tempfile.mkstemp(dir=BRAIN_DIR, prefix=".tmp-")
+        try:
+            os.write(fd, data)
+            os.fsync(fd)
+            os.close(fd)
+            fd = -1
+            os.chmod(tmp_path, _FILE_MODE)
+            try:
+                os.link(tmp_path, filepath)
+            except FileExistsError:
+                pass
+            except OSError:
+                # No hard links on this filesystem (EPERM/ENOTSUP, e.g. FAT or some
+                # network mounts): fall back to a plain O_EXCL create, still exclusive
+                try:
+                    out = os.open(filepath, os.O_CREAT | os.O_EXCL | os.O_WRONLY, _FILE_MODE)
+                except FileExistsError:
+                    continue
+                try:
+                    os.write(out, data)
+                    os.fsync(out)
+                finally:
+                    os.close(out)
+        finally:
+            if fd >= 0:
+                os.close(fd)
+            os.unlink(tmp_path)
+
+# Stripped file contents keyed by path, as (mtime_ns, size, content). One entry per
+# path: a changed file replaces its old content instead of piling up stale versions.
+_FILE_CACHE = {}
 
 def read_file_safe(filepath: str, default: str = "") -> str:
     """Reads a file safely, returning default if not found."""
-    if os.path.exists(filepath):
+    try:
+        # One stat replaces exists + open when the file hasn't changed
+        st = os.stat(filepath)
+        cached = _FILE_CACHE.get(filepath)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        with open(filepath, "r") as f:
+            content = f.read().strip()
+        _FILE_CACHE[filepath] = (st.st_mtime_ns, st.st_size, content)
+        return content
+    except (OSError, ValueError):
+        return default
+
+# Brain files that make up the System Prompt
+PROMPT_FILES = (AGENTS_FILE, IDENTITY_FILE, SOUL_FILE, USER_FILE, TOOLS_FILE, SHIELD_FILE, BOOTSTRAP_FILE)
+
+def _prompt_files_mtimes() -> tuple:
+    """Returns the mtime of each prompt file (None if missing), used as a cache key."""
+    mtimes = []
+    for filepath in PROMPT_FILES:
         try:
-            with open(filepath, "r") as f:
-                return f.read().strip()
-        except:
-            return default
-    return default
+            mtimes.append(os.stat(filepath).st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return tuple(mtimes)
 
-def build_system_prompt() -> str:
+@functools.lru_cache(maxsize=1)
+def _load_prompt_sections(mtimes: tuple) -> tuple:
     """
-    Constructs the System Prompt by reading the brain markdown files.
+    Reads the brain markdown files for the System Prompt.
+    Cached on the files' mtimes, so the files are only re-read after they change.
     """
-    agents_content = read_file_safe(AGENTS_FILE, "SAFETY CRITICAL: Agents instructions missing.")
-    identity_content = read_file_safe(IDENTITY_FILE, "Identity unknown.")
-    soul_content = read_file_safe(SOUL_FILE, "I am a helpful assistant.")
-    user_content = read_file_safe(USER_FILE, "User context unknown.")
-    tools_content = read_file_safe(TOOLS_FILE, "Tools unknown.")
-
-    shield_content = read_file_safe(SHIELD_FILE, "Security policy unknown.")
-    bootstrap_content = read_file_safe(BOOTSTRAP_FILE, "")
-    
-    # Dynamic Context
-    import platform
-    cwd = os.getcwd()
-    user = os.getlogin()
-    home = os.path.expanduser("~")
-    now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    os_name = platform.system()
-    os_release = platform.release()
-    
-    prompt = f"""
+    return (
+        read_file_safe(AGENTS_FILE, "SAFETY CRITICAL: Agents instructions missing."),
+        read_file_safe(IDENTITY_FILE, "Identity unknown."),
+        read_file_safe(SOUL_FILE, "I am a helpful assistant."),
+        read_file_safe(USER_FILE, "User context unknown."),
+        read_file_safe(TOOLS_FILE, "Tools unknown."),
+        read_file_safe(SHIELD_FILE, "Security policy unknown."),
+        read_file_safe(BOOTSTRAP_FILE, ""),
+    )
+
+def atomic_write(filepath: str, data: bytes) -> os.stat_result:
+    """
+    Writes data to filepath atomically: a temp file in the same directory is
+    fsynced and then renamed over the target, so a crash never leaves a torn file.
+    Returns the stat of the file written (the rename keeps its inode and mtime).
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(filepath) or ".", prefix=".tmp-")
+    try:
+        os.write(fd, data)
+        os.fsync(fd)
+        st = os.fstat(fd)
+        os.close(fd)
+        fd = -1
+        os.chmod(tmp_path, _FILE_MODE)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        if fd >= 0:
+            os.close(fd)
+        os.unlink(tmp_path)
+        raise
+    return st
+
+# Files at least this large are parsed straight from an mmap instead of read()
+_MMAP_THRESHOLD = 64 * 1024
+
+def load_json_file(filepath: str, default=None):
+    """
+    Parses a JSON file (e.g. SCHEDULE.json), returning default if it doesn't exist.
+    Uses orjson when installed; raises ValueError on malformed content.
+    """
+    try:
+        f = open(filepath, "rb")
+    except FileNotFoundError:
+        return default
+    with f:
+        if orjson is not None and os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+            # Parse from the page cache mapping, skipping the copy into a bytes object
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, "madvise"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def save_json_file(filepath: str, obj) -> os.stat_result:
+    """
+    Serializes obj to a UTF-8 JSON file (2-space indent), written atomically.
+    Returns the stat of the file written.
+    """
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return atomic_write(filepath, data)
+
+# Dedicated pool for blocking brain/ file I/O from async code (heartbeat, async tools).
+# Workers stay warm across calls instead of going through the shared default executor.
+_IO_EXEC = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="brain-io")
+
+async def run_io(fn, *args):
+    """Runs the blocking call fn(*args) on the brain-io pool and awaits its result."""
+    return await asyncio.get_running_loop().run_in_executor(_IO_EXEC, fn, *args)
+
+# System Prompt layout, filled by build_system_prompt with a single format_map
+_PROMPT_TEMPLATE = """
     [SYSTEM CONTEXT]
-    OS: {os_name} ({os_release})
-    User: {user}
-    Home: {home}
+    {sys_context}
     CWD: {cwd} (Current working context)
     Time: {now}
 
     [INSTRUCTIONS]
-    {agents_content}
+    {agents}
 
     [SHIELD]
-    {shield_content}
+    {shield}
 
     [BOOTSTRAP]
-    {bootstrap_content}
+    {bootstrap}
 
     [IDENTITY]
-    {identity_content}
+    {identity}
 
     [SOUL]
-    {soul_content}
+    {soul}
 
     [USER]
-    {user_content}
+    {user}
 
     [TOOLS]
-    {tools_content}
+    {tools}
+    """.strip()
+
+def _login_name() -> str:
+    """
+    Login name from the environment, then the password database (systemd units and
+    cron often have no USER). Not os.getlogin(): it raises without a controlling
+    terminal (daemon, systemd, some IDEs).
+    """
+    name = os.environ.get("USER") or os.environ.get("USERNAME")
+    if name:
+        return name
+    try:
+        import pwd  # POSIX only
+        return pwd.getpwuid(os.getuid()).pw_name
+    except (ImportError, KeyError):
+        return "unknown"
+
+_USER = _login_name()
+
+@functools.lru_cache(maxsize=1)
+def _prompt_template() -> str:
+    """
+    _PROMPT_TEMPLATE with the OS/User/Home lines filled in, built once per process
+    (they never change while it runs). Braces in them are escaped for format_map.
     """
-    return prompt.strip()
+    sys_context = (
+        f"OS: {platform.system()} ({platform.release()})\n"
+        f"    User: {_USER}\n"
+        f"    Home: {os.path.expanduser('~')}"
+    )
+    return _PROMPT_TEMPLATE.replace(
+        "{sys_context}", sys_context.replace("{", "{{").replace("}", "}}")
+    )
+
+def build_system_prompt() -> str:
+    """
+    Constructs the System Prompt by reading the brain markdown files.
+    """
+    (
+        agents_content,
+        identity_content,
+        soul_content,
+        user_content,
+        tools_content,
+        shield_content,
+        bootstrap_content,
+    ) = _load_prompt_sections(_prompt_files_mtimes())
+    
+    # Dynamic Context (OS, user and home are already in the template; see _prompt_template)
+    return _prompt_template().format_map({
+        "cwd": os.getcwd(),
+        "now": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "agents": agents_content,
+        "shield": shield_content,
+        "bootstrap": bootstrap_content,
+        "identity": identity_content,
+        "soul": soul_content,
+        "user": user_content,
+        "tools": tools_content,
+    }).rstrip()  # An empty TOOLS.md would otherwise leave trailing whitespace
+
+# Parsed config.json, keyed by the file's mtime so edits made from the TUI
+# (/config, /skills) are picked up without re-parsing on every agent turn.
+_CONFIG_CACHE = {"mtime": None, "value": None}
+# Resolved once: the app runs from its root directory (brain/ paths are relative to it too)
+_CONFIG_PATH = os.path.join(os.getcwd(), "config.json")
 
 def load_config():
     """Loads the configuration from config.json."""
-    config_path = os.path.join(os.getcwd(), "config.json")
-    if os.path.exists(config_path):
+    config_path = _CONFIG_PATH
+    try:
+        mtime = os.stat(config_path).st_mtime_ns
+    except OSError:
+        mtime = None
+
+    if mtime is not None:
+        if _CONFIG_CACHE["mtime"] == mtime:
+            return _CONFIG_CACHE["value"]
         try:
-            with open(config_path, "r") as f:
-                return json.load(f)
-        except:
+            # orjson (via load_json_file) when installed
+            config = load_json_file(config_path)
+            if config is not None:  # Not deleted since the stat
+                _CONFIG_CACHE["mtime"] = mtime
+                _CONFIG_CACHE["value"] = config
+                return config
+        except (OSError, ValueError):
+            # Unreadable or malformed (incl. half-written) config: fall back to defaults
             pass
     return {"provider": "google", "model": "gemini-2.0-flash"}
@@ -1,10 +1,12 @@
+import types
+
 # Centralized mapping of Providers to their Supported Models
 
 PROVIDERS = {
     "google": {
         "name": "Google (Gemini)",
         "env_var": "GOOGLE_API_KEY",
-        "chat_models": [
+        "chat_models": (
             "gemini-2.5-flash",
             "gemini-2.5-pro",
             "gemini-2.5-flash-lite",
@@ -12,14 +14,14 @@ PROVIDERS = {
             "gemini-3.1-pro-preview",
             "gemini-3-flash-preview",
             "gemini-3-pro-preview"
-        ],
-        "tts_models": ["gemini-2.5-flash-preview-tts", "gemini-2.5-pro-preview-tts"],
-        "stt_models": ["gemini-2.5-flash", "gemini-2.0-flash"]
+        ),
+        "tts_models": ("gemini-2.5-flash-preview-tts", "gemini-2.5-pro-preview-tts"),
+        "stt_models": ("gemini-2.5-flash", "gemini-2.0-flash")
     },
     "openai": {
         "name": "OpenAI",
         "env_var": "OPENAI_API_KEY",
-        "chat_models": [
+        "chat_models": (
             "gpt-5.2",
             "gpt-4.1",
             "gpt-4.1-mini",
@@ -28,37 +30,37 @@ PROVIDERS = {
             "gpt-4o-mini",
             "o3",
             "o4-mini"
-        ],
-        "tts_models": ["tts-1", "tts-1-hd"],
-        "stt_models": ["whisper-1"]
+        ),
+        "tts_models": ("tts-1", "tts-1-hd"),
+        "stt_models": ("whisper-1",)
     },
     "anthropic": {
         "name": "Anthropic",
         "env_var": "ANTHROPIC_API_KEY",
-        "chat_models": [
+        "chat_models": (
             "claude-opus-4-6",
             "claude-sonnet-4-6",
             "claude-haiku-4-5"
-        ],
-        "tts_models": [],
-        "stt_models": []
+        ),
+        "tts_models": (),
+        "stt_models": ()
     },
     "groq": {
         "name": "Groq",
         "env_var": "GROQ_API_KEY",
-        "chat_models": [
+        "chat_models": (
             "llama-3.3-70b-versatile",
             "llama-3.1-8b-instant",
             "openai/gpt-oss-120b",
             "openai/gpt-oss-20b"
-        ],
-        "tts_models": [],
-        "stt_models": ["whisper-large-v3", "whisper-large-v3-turbo"]
+        ),
+        "tts_models": (),
+        "stt_models": ("whisper-large-v3", "whisper-large-v3-turbo")
     },
     "mistral": {
         "name": "Mistral AI",
         "env_var": "MISTRAL_API_KEY",
-        "chat_models": [
+        "chat_models": (
             "mistral-large-3-latest",
             "mistral-medium-3.1-latest",
             "mistral-small-3.2-latest",
@@ -66,14 +68,14 @@ PROVIDERS = {
             "pixtral-large-latest",
             "ministral-8b-latest",
             "ministral-3b-latest"
-        ],
-        "tts_models": [],
-        "stt_models": []
+        ),
+        "tts_models": (),
+        "stt_models": ()
     },
     "ollama": {
         "name": "Ollama (Local)",
         "env_var": None,  # Ollama runs locally without an API key typically
-        "chat_models": [
+        "chat_models": (
             "llama3.3",
             "llama3.2",
             "qwen3",
@@ -84,38 +86,49 @@ PROVIDERS = {
             "mistral",
             "deepseek-r1",
             "deepseek-v3"
-        ],
-        "tts_models": [],
-        "stt_models": []
+        ),
+        "tts_models": (),
+        "stt_models": ()
     },
     "xai": {
         "name": "xAI",
         "env_var": "XAI_API_KEY",
-        "chat_models": [
+        "chat_models": (
             "grok-4",
             "grok-3",
             "grok-3-mini"
-        ],
-        "tts_models": [],
-        "stt_models": []
+        ),
+        "tts_models": (),
+        "stt_models": ()
     }
 }
 
+# Returned for unknown providers / missing keys (shared, immutable)
+_EMPTY = ()
+
+# Read-only view: callers share PROVIDERS and can't add or replace providers by accident
+PROVIDERS = types.MappingProxyType(PROVIDERS)
+
+# (name, id) pairs for Select UI dropdowns, built once
+_PROVIDER_LIST = tuple((pd["name"], pid) for pid, pd in PROVIDERS.items())
+
+# Model tuples per provider id, so each getter is a single dict lookup
+_CHAT = {pid: tuple(pd.get("chat_models", _EMPTY)) for pid, pd in PROVIDERS.items()}
+_TTS = {pid: tuple(pd.get("tts_models", _EMPTY)) for pid, pd in PROVIDERS.items()}
+_STT = {pid: tuple(pd.get("stt_models", _EMPTY)) for pid, pd in PROVIDERS.items()}
+
 def get_provider_list():
-    """Return a list of tuples (name, id) for Select UI dropdowns."""
-    return [(pd["name"], pid) for pid, pd in PROVIDERS.items()]
+    """Return a tuple of (name, id) tuples for Select UI dropdowns."""
+    return _PROVIDER_LIST
 
 def get_chat_models(provider_id: str):
-    """Return a list of chat models for a given provider."""
-    provider_data = PROVIDERS.get(provider_id, {})
-    return provider_data.get("chat_models", [])
+    """Return a tuple of chat models for a given provider."""
+    return _CHAT.get(provider_id, _EMPTY)
 
 def get_tts_models(provider_id: str):
-    """Return a list of TTS models for a given provider."""
-    provider_data = PROVIDERS.get(provider_id, {})
-    return provider_data.get("tts_models", [])
+    """Return a tuple of TTS models for a given provider."""
+    return _TTS.get(provider_id, _EMPTY)
 
 def get_stt_models(provider_id: str):
-    """Return a list of STT models for a given provider."""
-    provider_data = PROVIDERS.get(provider_id, {})
-    return provider_data.get("stt_models", [])
+    """Return a tuple of STT models for a given provider."""
+    return _STT.get(provider_id, _EMPTY)
@@ -1,24 +1,70 @@
-import time
 import sys
 import os
 import signal
-from agent import app, run_autonomous_heartbeat
+import asyncio
+import atexit
+from agent import app, run_autonomous_heartbeat, seconds_until_next_task
 from brain.memory_manager import read_file_safe, BRAIN_DIR
 import datetime
 
 # Daemon configuration
-LOOP_INTERVAL = 60  # Check every 60 seconds
+LOOP_INTERVAL = 60  # Check at least every 60 seconds (sooner if a task is due)
+
+# Line-buffered append handle for daemon.log, opened on first use and kept open
+_LOG_FH = {"fh": None}
+
+def _close_log():
+    """Closes the daemon.log handle, if open."""
+    if _LOG_FH["fh"] is not None:
+        _LOG_FH["fh"].close()
+        _LOG_FH["fh"] = None
+
+atexit.register(_close_log)
 
 def log_daemon(message):
     """
     Logs daemon activity to a dedicated file.
     """
     timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    log_file = os.path.join(BRAIN_DIR, "daemon.log")
-    with open(log_file, "a") as f:
-        f.write(f"[{timestamp}] {message}\n")
+    fh = _LOG_FH["fh"]
+    if fh is None:
+        fh = _LOG_FH["fh"] = open(os.path.join(BRAIN_DIR, "daemon.log"), "a", buffering=1)
+    fh.write(f"[{timestamp}] {message}\n")
     print(f"[{timestamp}] {message}")
 
+async def _daemon_loop():
+    """
+    Heartbeat/agent loop. Runs on a single event loop so cached LLM clients
+    (and their async HTTP pools) stay bound to the same loop across ticks.
+    """
+    while True:
+        # Run the heartbeat check
+        # This checks SCHEDULE.json and HEARTBEAT.md
+        result = await run_autonomous_heartbeat()
+        
+        if result:
+            log_daemon(f"❤️  Heartbeat Triggered:\n{result}")
+            
+            # Create a message to feed into the agent
+            # This simulates a "System" or "Scheduler" message
+            from langchain_core.messages import HumanMessage
+            
+            # We treat the heartbeat result as a user prompt
+            # e.g. "Scheduled Task Due: Check emails"
+            message = HumanMessage(content=result)
+            
+            # Invoke the graph!
+            log_daemon("🚀 Executing Agent Workflow...")
+            final_state = await app.ainvoke({"messages": [message]})
+            
+            # Log the result
+            last_msg = final_state["messages"][-1]
+            log_daemon(f"✅ Agent Response: {last_msg.content}")
+            
+        # Wake for the next scheduled task instead of up to a minute late. The cap keeps
+        # the heartbeat and newly added tasks (schedule_task from the TUI) on time.
+        await asyncio.sleep(seconds_until_next_task(LOOP_INTERVAL))
+
 def run_daemon():
     """
     Main loop for the background daemon.
@@ -26,32 +72,7 @@ def run_daemon():
     log_daemon("👻 Space Black Daemon Started. Press Ctrl+C to stop.")
     
     try:
-        while True:
-            # Run the heartbeat check
-            # This checks SCHEDULE.json and HEARTBEAT.md
-            result = run_autonomous_heartbeat()
-            
-            if result:
-                log_daemon(f"❤️  Heartbeat Triggered:\n{result}")
-                
-                # Create a message to feed into the agent
-                # This simulates a "System" or "Scheduler" message
-                from langchain_core.messages import HumanMessage
-                
-                # We treat the heartbeat result as a user prompt
-                # e.g. "Scheduled Task Due: Check emails"
-                message = HumanMessage(content=result)
-                
-                # Invoke the graph!
-                log_daemon("🚀 Executing Agent Workflow...")
-                final_state = app.invoke({"messages": [message]})
-                
-                # Log the result
-                last_msg = final_state["messages"][-1]
-                log_daemon(f"✅ Agent Response: {last_msg.content}")
-                
-            time.sleep(LOOP_INTERVAL)
-            
+        asyncio.run(_daemon_loop())
     except KeyboardInterrupt:
         log_daemon("🛑 Daemon stopped by user.")
         sys.exit(0)
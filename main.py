@@ -1,13 +1,32 @@
 
 import os
 import sys
-import subprocess
-from textual.app import App
-from brain.memory_manager import ensure_brain_initialized
+import threading
 
 CONFIG_FILE = "config.json"
 ENV_FILE = ".env"
 
+# Background bots launched by main(): (config.json skill key, label, script path).
+# Add new long-running skills here.
+_BOT_SKILLS = (
+    ("telegram", "Telegram Bot", os.path.join("tools", "skills", "telegram", "bot.py")),
+    ("discord", "Discord Bot", os.path.join("tools", "skills", "discord", "bot.py")),
+    ("slack", "Slack Bot", os.path.join("tools", "skills", "slack", "bot.py")),
+)
+
+def _preload_llm():
+    """Builds the configured chat model once so get_llm's client cache is warm."""
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+        from brain.memory_manager import load_config
+        from brain.llm_factory import get_llm
+        config = load_config()
+        # Same arguments as the agent's turns (temperature 0), so the cached client is reused
+        get_llm(config["provider"], config["model"], temperature=0)
+    except Exception:
+        pass  # Best effort: the first turn builds it instead
+
 def main():
     """
     Main entry point.
@@ -22,6 +41,11 @@ def main():
             run_daemon()
             return
 
+    # Imported only on the interactive path; daemon mode above never needs them
+    import atexit
+    import subprocess
+    from brain.memory_manager import ensure_brain_initialized, load_config
+
     print("Checking configuration...")
     ensure_brain_initialized()
     
@@ -45,6 +69,10 @@ def main():
         print("Setup complete. Starting Agent...")
     
     
+    # Warm up the chat model (provider SDK import + client) while the banner,
+    # bots and TUI start, so the first message doesn't pay for it
+    threading.Thread(target=_preload_llm, daemon=True).start()
+
     # Print "Space Black" banner (Simulating figlet)
     # Color: \033[38;2;27;242;34m (Green)
     banner = r"""
@@ -62,55 +90,44 @@ def main():
     # Process Management
     processes = []
 
-    # 1. Start Telegram Bot if enabled
+    # Start every enabled background bot (Telegram, Discord, Slack)
     try:
-        import json
-        with open(CONFIG_FILE, "r") as f:
-            config = json.load(f)
-            
-        tg_config = config.get("skills", {}).get("telegram", {})
-        if tg_config.get("enabled"):
-            print("🚀 Launching Telegram Bot...")
-            # Use sys.executable to ensure same venv
-            # bot.py is in tools/skills/telegram/bot.py
-            bot_path = os.path.join("tools", "skills", "telegram", "bot.py")
+        # Parsed once and cached by mtime (shared with the agent and the preload thread)
+        config = load_config()
+        skills_config = config.get("skills", {})
+        to_launch = []
+        for skill, label, bot_path in _BOT_SKILLS:
+            if not skills_config.get(skill, {}).get("enabled"):
+                continue
+            print(f"🚀 Launching {label}...")
+            # Popen of the interpreter succeeds even if the script is missing, so check first
             if os.path.exists(bot_path):
-                 # Run in background
-                 p = subprocess.Popen([sys.executable, bot_path])
-                 processes.append(p)
-                 print(f"   Telegram Bot PID: {p.pid}")
-            else:
-                 print(f"⚠️  Telegram Bot script not found at {bot_path}")
-                 
-        # 2. Start Discord Bot if enabled
-        discord_config = config.get("skills", {}).get("discord", {})
-        if discord_config.get("enabled"):
-            print("🚀 Launching Discord Bot...")
-            discord_bot_path = os.path.join("tools", "skills", "discord", "bot.py")
-            if os.path.exists(discord_bot_path):
-                 p = subprocess.Popen([sys.executable, discord_bot_path])
-                 processes.append(p)
-                 print(f"   Discord Bot PID: {p.pid}")
-            else:
-                 print(f"⚠️  Discord Bot script not found at {discord_bot_path}")
-                 
-        # 3. Start Slack Bot if enabled
-        slack_config = config.get("skills", {}).get("slack", {})
-        if slack_config.get("enabled"):
-            print("🚀 Launching Slack Bot...")
-            slack_bot_path = os.path.join("tools", "skills", "slack", "bot.py")
-            if os.path.exists(slack_bot_path):
-                 p = subprocess.Popen([sys.executable, slack_bot_path])
-                 processes.append(p)
-                 print(f"   Slack Bot PID: {p.pid}")
+                to_launch.append((label, bot_path))
             else:
-                 print(f"⚠️  Slack Bot script not found at {slack_bot_path}")
-                 
+                print(f"⚠️  {label} script not found at {bot_path}")
+
+        if to_launch:
+            # Spawn the bots concurrently so their fork/exec latencies overlap
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=len(to_launch)) as pool:
+                # Run in background, with sys.executable to ensure same venv
+                launches = [
+                    (label, pool.submit(subprocess.Popen, [sys.executable, bot_path]))
+                    for label, bot_path in to_launch
+                ]
+            for label, future in launches:
+                try:
+                    p = future.result()
+                except OSError as e:
+                    print(f"⚠️  Failed to launch {label}: {e}")
+                    continue
+                processes.append(p)
+                print(f"   {label} PID: {p.pid}")
+
     except Exception as e:
         print(f"⚠️  Failed to launch background skills: {e}")
 
     # Register robust cleanup handler
-    import atexit
     def cleanup_background_processes():
         print("\nStopping background services...")
         for p in processes:
@@ -126,9 +143,11 @@ def main():
 
     atexit.register(cleanup_background_processes)
 
-    # 3. Start TUI (Blocking)
+    # 3. Start TUI (Blocking), in this process: a child interpreter would
+    # repeat the whole textual/langchain import on every launch
     try:
-        subprocess.run([sys.executable, "tui.py"])
+        from tui import main as run_tui
+        run_tui()
     except KeyboardInterrupt:
         print("\nAgent stopped.")
     finally:
@@ -2,7 +2,7 @@
 import os
 import json
 import time
-from brain.llm_factory import get_llm
+from brain.llm_factory import get_llm, clear_llm_cache
 from brain.provider_models import get_provider_list, get_chat_models, get_tts_models, get_stt_models, PROVIDERS
 from rich.console import Console
 from rich.prompt import Prompt, Confirm
@@ -68,6 +68,9 @@ def save_config(provider: str, model: str, voice_provider: str, tts_model: str,
     with open(ENV_FILE, "w") as f:
         f.writelines(new_lines)
 
+    # Keys changed in os.environ: don't reuse clients or keys cached before this
+    clear_llm_cache()
+
 def main():
     clear_screen()
     console.print(Panel.fit("[bold cyan]Space Black | Setup Wizard[/]", border_style="cyan"))
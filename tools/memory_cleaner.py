@@ -1,56 +1,88 @@
 import os
 import re
+import tempfile
+import collections
+
+# Memory log line: "[HH:MM:SS] Content...", compiled once instead of per line
+_TIMESTAMP_RE = re.compile(r"\[.*?\] (.*)")
+
+# How many recent distinct entries a new entry is checked against for duplicates
+_DEDUP_WINDOW = 1024
 
 def clean_memory_file(filepath):
+    """
+    Drops duplicate entries (repeats of any of the last _DEDUP_WINDOW distinct
+    entries, not just the previous one) from a memory log in one streaming pass.
+    Survivors go to a temp file that atomically replaces the log only if something
+    was removed. Returns the number of lines removed.
+    """
     if not os.path.exists(filepath):
         print(f"File not found: {filepath}")
-        return
+        return 0
 
     print(f"Cleaning {filepath}...")
-    with open(filepath, 'r') as f:
-        lines = f.readlines()
-
-    new_lines = []
     last_content = ""
     hidden_count = 0
+    # Recent distinct entries: the deque gives eviction order, the set O(1) lookups
+    window = collections.deque()
+    seen = set()
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(filepath) or ".", prefix=".tmp-")
+    try:
+        with open(filepath, 'r') as fin, os.fdopen(fd, 'w') as fout:
+            for line in fin:
+                # Extract content after timestamp
+                # Format: [HH:MM:SS] Content...
+                match = _TIMESTAMP_RE.match(line)
+                if match:
+                    content = match.group(1).strip()
+
+                    # Smart Filter for "Gathering user information"
+                    if "Gathering user information" in content:
+                        if "Gathering user information" in last_content:
+                            hidden_count += 1
+                            continue
+
+                    # Generic Deduplication
+                    if content in seen:
+                        hidden_count += 1
+                        continue
+
+                    if len(window) == _DEDUP_WINDOW:
+                        seen.discard(window.popleft())
+                    window.append(content)
+                    seen.add(content)
+                    last_content = content
+                fout.write(line)
+
+            if hidden_count > 0:
+                # Other processes (TUI, daemon, bots) append with O_APPEND while we
+                # scan: carry anything they added over so the swap doesn't drop it
+                fout.write(fin.read())
+                fout.flush()
+                if os.stat(filepath).st_ino != os.fstat(fin.fileno()).st_ino:
+                    hidden_count = 0  # Replaced meanwhile (another cleaner): leave it be
+                else:
+                    os.chmod(tmp_path, 0o644)
+                    os.replace(tmp_path, filepath)
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)  # Nothing removed (or we failed): leave the log untouched
 
-    for line in lines:
-        # Extract content after timestamp
-        # Format: [HH:MM:SS] Content...
-        match = re.match(r"\[.*?\] (.*)", line)
-        if match:
-            content = match.group(1).strip()
-            
-            # Smart Filter for "Gathering user information"
-            if "Gathering user information" in content:
-                if "Gathering user information" in last_content:
-                    hidden_count += 1
-                    continue
-            
-            # Generic Deduplication
-            if content == last_content:
-                hidden_count += 1
-                continue
-
-            last_content = content
-            new_lines.append(line)
-        else:
-            new_lines.append(line)
-
-    with open(filepath, 'w') as f:
-        f.writelines(new_lines)
-    
     if hidden_count > 0:
         print(f"✅ Removed {hidden_count} duplicate lines.")
     else:
         print("✨ File was already clean.")
+    return hidden_count
 
 if __name__ == "__main__":
     # Clean all files in brain/memory
     memory_dir = "brain/memory"
     if os.path.exists(memory_dir):
-        for filename in os.listdir(memory_dir):
-            if filename.endswith(".md"):
-                clean_memory_file(os.path.join(memory_dir, filename))
+        # scandir entries carry the file type, so no extra stat or path join per file
+        with os.scandir(memory_dir) as it:
+            for entry in it:
+                if entry.is_file(follow_symlinks=False) and entry.name.endswith(".md"):
+                    clean_memory_file(entry.path)
     else:
         print("No memory directory found.")
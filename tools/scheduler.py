@@ -1,9 +1,8 @@
 
-import json
 import datetime
 import os
 from langchain_core.tools import tool
-from brain.memory_manager import SCHEDULE_FILE, read_file_safe
+from brain.memory_manager import SCHEDULE_FILE, load_json_file, save_json_file
 
 @tool
 def schedule_task(time_str: str, task: str, recurrence: str = None):
@@ -21,12 +20,12 @@ def schedule_task(time_str: str, task: str, recurrence: str = None):
     """
     try:
         # Validate format
-        datetime.datetime.strptime(time_str, "%Y-%m-%d %H:%M")
+        dt = datetime.datetime.strptime(time_str, "%Y-%m-%d %H:%M")
         
-        current_content = read_file_safe(SCHEDULE_FILE, "[]")
-        schedule = json.loads(current_content)
+        schedule = load_json_file(SCHEDULE_FILE, [])
         
-        entry = {"time": time_str, "task": task}
+        # "ts" (epoch seconds) drives the scheduler; "time" is kept for display
+        entry = {"time": time_str, "ts": int(dt.timestamp()), "task": task}
         if recurrence:
             entry["recurrence"] = recurrence
             
@@ -35,8 +34,7 @@ def schedule_task(time_str: str, task: str, recurrence: str = None):
         # Sort by time
         schedule.sort(key=lambda x: x["time"])
         
-        with open(SCHEDULE_FILE, "w") as f:
-            json.dump(schedule, f, indent=4)
+        save_json_file(SCHEDULE_FILE, schedule)
             
         msg = f"Task scheduled for {time_str}: {task}"
         if recurrence:
@@ -56,8 +54,7 @@ def cancel_task(task_query: str):
                     e.g. "bitcoin" will cancel any task containing "bitcoin".
     """
     try:
-        current_content = read_file_safe(SCHEDULE_FILE, "[]")
-        schedule = json.loads(current_content)
+        schedule = load_json_file(SCHEDULE_FILE, [])
         
         initial_count = len(schedule)
         # Filter out matching tasks
@@ -84,8 +81,7 @@ def cancel_task(task_query: str):
         if removed_count == 0:
             return f"No tasks found matching query: '{task_query}'."
             
-        with open(SCHEDULE_FILE, "w") as f:
-            json.dump(new_schedule, f, indent=4)
+        save_json_file(SCHEDULE_FILE, new_schedule)
             
         return f"Cancelled {removed_count} task(s) matching '{task_query}'."
         
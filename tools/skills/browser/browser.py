@@ -55,6 +55,9 @@ _MAX_ELEMENTS = 80
 _SMART_WAIT_TIMEOUT = 4000          # ms — networkidle fallback
 _NAV_TIMEOUT = 30_000               # ms
 _DEFAULT_VIEWPORT = {"width": 1366, "height": 768}
+# Attach to an already-running Chromium (started with --remote-debugging-port) instead
+# of launching one per process, e.g. PW_CDP_ENDPOINT=http://127.0.0.1:9222
+_CDP_ENDPOINT = os.environ.get("PW_CDP_ENDPOINT")
 
 # Roles that the agent can interact with
 _INTERACTIVE_ROLES = frozenset({
@@ -538,6 +541,7 @@ class BrowserSession:
     _context: Optional[BrowserContext] = None
     _page: Optional[Page] = None
     _cdp: Optional[CDPSession] = None
+    _shared: bool = False  # Connected over CDP: the browser isn't ours to close
     _lock: asyncio.Lock = asyncio.Lock()
 
     @classmethod
@@ -578,6 +582,10 @@ class BrowserSession:
 
         cls._playwright = await async_playwright().start()
 
+        if _CDP_ENDPOINT:
+            await cls._connect_shared(_CDP_ENDPOINT)
+            return
+
         _PROFILE_DIR.mkdir(parents=True, exist_ok=True)
 
         launch_args = [
@@ -612,6 +620,29 @@ class BrowserSession:
         cls._cdp = await cls._context.new_cdp_session(cls._page)
         await cls._cdp.send("Accessibility.enable")
         cls._browser = None  # persistent context doesn't use separate browser
+        cls._shared = False
+
+    @classmethod
+    async def _connect_shared(cls, endpoint: str) -> None:
+        """Reuses a running Chromium over CDP, skipping browser cold start."""
+        log.info("Connecting to existing browser at %s", endpoint)
+        cls._browser = await cls._playwright.chromium.connect_over_cdp(endpoint)
+        cls._shared = True
+        # The default context carries the running browser's profile (logins, cookies)
+        if cls._browser.contexts:
+            cls._context = cls._browser.contexts[0]
+        else:
+            cls._context = await cls._browser.new_context(
+                viewport=_DEFAULT_VIEWPORT,
+                user_agent=_USER_AGENT,
+                locale="en-US",
+                timezone_id="America/New_York",
+                ignore_https_errors=True,
+            )
+        await cls._context.add_init_script(_STEALTH_JS)
+        cls._page = await cls._context.new_page()
+        cls._cdp = await cls._context.new_cdp_session(cls._page)
+        await cls._cdp.send("Accessibility.enable")
 
     @classmethod
     async def close_all(cls) -> None:
@@ -620,12 +651,19 @@ class BrowserSession:
                 await cls._cdp.detach()
             except Exception:
                 pass
-        if cls._context:
+        if cls._shared and cls._page:
+            # Leave the shared browser and its profile running; only drop our tab
+            try:
+                await cls._page.close()
+            except Exception:
+                pass
+        elif cls._context:
             try:
                 await cls._context.close()
             except Exception:
                 pass
         if cls._browser:
+            # For a CDP connection this only disconnects
             try:
                 await cls._browser.close()
             except Exception:
@@ -636,6 +674,7 @@ class BrowserSession:
             except Exception:
                 pass
         cls._playwright = cls._browser = cls._context = cls._page = cls._cdp = None
+        cls._shared = False
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
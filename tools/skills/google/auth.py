@@ -11,6 +11,7 @@ Handles token refresh and triggers first-time browser consent flow.
 
 import os
 import json
+import threading
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
@@ -80,23 +81,24 @@ def _get_oauth_flow(google_config: dict, scopes: list) -> InstalledAppFlow:
     return InstalledAppFlow.from_client_config(client_config, scopes)
 
 
-def get_google_service(service_name: str, version: str, scopes: list = None):
-    """
-    Returns an authenticated Google API service client.
+# Credentials shared by every service, reused while still valid and google_token.json
+# is unchanged on disk. The lock makes concurrent tool calls load/refresh them once.
+_CREDS_LOCK = threading.Lock()
+_CREDS = {"key": None, "creds": None}
+# Built service clients per thread: httplib2 connections aren't thread-safe, and
+# tool calls run on executor threads that are reused across invocations
+_SERVICES = threading.local()
 
-    Args:
-        service_name: e.g. 'gmail', 'drive', 'docs', 'sheets', 'calendar'
-        version: e.g. 'v1', 'v3', 'v4'
-        scopes: Optional list of scopes. Defaults to ALL_SCOPES.
 
-    Returns:
-        googleapiclient.discovery.Resource
-    """
-    from googleapiclient.discovery import build
+def _token_mtime():
+    try:
+        return os.stat(TOKEN_PATH).st_mtime_ns
+    except OSError:
+        return None
 
-    if scopes is None:
-        scopes = ALL_SCOPES
 
+def _get_credentials(scopes: list) -> Credentials:
+    """Loads, refreshes or (first time) authorizes OAuth credentials for scopes."""
     creds = None
 
     # Load existing token
@@ -125,4 +127,46 @@ def get_google_service(service_name: str, version: str, scopes: list = None):
         with open(TOKEN_PATH, "w") as token_file:
             token_file.write(creds.to_json())
 
-    return build(service_name, version, credentials=creds)
+    return creds
+
+
+def get_google_service(service_name: str, version: str, scopes: list = None):
+    """
+    Returns an authenticated Google API service client.
+    Credentials and built clients are cached, so repeated tool calls skip the
+    token load and the discovery document parse.
+
+    Args:
+        service_name: e.g. 'gmail', 'drive', 'docs', 'sheets', 'calendar'
+        version: e.g. 'v1', 'v3', 'v4'
+        scopes: Optional list of scopes. Defaults to ALL_SCOPES.
+
+    Returns:
+        googleapiclient.discovery.Resource
+    """
+    from googleapiclient.discovery import build
+
+    if scopes is None:
+        scopes = ALL_SCOPES
+    scopes_key = tuple(scopes)
+
+    with _CREDS_LOCK:
+        creds = _CREDS["creds"]
+        if _CREDS["key"] != (scopes_key, _token_mtime()) or not creds.valid:
+            creds = _get_credentials(scopes)
+            # Keyed by the mtime after any token save above
+            _CREDS["key"] = (scopes_key, _token_mtime())
+            _CREDS["creds"] = creds
+
+    services = getattr(_SERVICES, "cache", None)
+    if services is None:
+        services = _SERVICES.cache = {}
+    key = (service_name, version, scopes_key)
+    cached = services.get(key)
+    if cached is not None and cached[0] is creds:
+        return cached[1]
+
+    # Bundled (static) discovery document; no on-disk discovery cache lookup
+    service = build(service_name, version, credentials=creds, cache_discovery=False)
+    services[key] = (creds, service)
+    return service
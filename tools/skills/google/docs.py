@@ -3,10 +3,24 @@ docs.py — Space Black Google Docs API Tool
 Provides a single tool entry point `docs_act` for managing Google Docs.
 """
 
+import json
+import traceback
 from typing import Optional
 from langchain_core.tools import tool
 
 
+# Partial-response mask for read_doc: only the text, not styles, lists,
+# inline objects, headers/footers and suggestions
+_READ_FIELDS = "title,body(content(paragraph(elements(textRun(content)))))"
+
+
+def _batch_update(docs_service, document_id: str, requests_body: list) -> dict:
+    """Sends all of requests_body to a document in one batchUpdate call."""
+    return docs_service.documents().batchUpdate(
+        documentId=document_id, body={"requests": requests_body}
+    ).execute()
+
+
 def _get_docs_service():
     from tools.skills.google.auth import get_google_service
     return get_google_service("docs", "v1")
@@ -27,6 +41,7 @@ def docs_act(
     find: Optional[str] = None,
     replace: Optional[str] = None,
     max_results: Optional[int] = 20,
+    requests: Optional[str] = None,
 ) -> str:
     """
     A unified tool for interacting with Google Docs.
@@ -37,6 +52,9 @@ def docs_act(
     - 'append_text': Append text to end of doc. (Requires 'document_id', 'text')
     - 'insert_text': Insert text at a position. (Requires 'document_id', 'text', 'index')
     - 'replace_text': Find and replace text. (Requires 'document_id', 'find', 'replace')
+    - 'batch_edit': Apply several edits in one call. (Requires 'document_id', 'requests':
+      a JSON list of Docs API requests, e.g. [{"insertText": {...}}, {"replaceAllText": {...}}])
+      Prefer this over several append/insert/replace calls when making multiple edits.
     - 'list_docs': List recent documents.
     """
     try:
@@ -54,34 +72,27 @@ def docs_act(
         elif action == "read_doc":
             if not document_id:
                 return "Error: Missing 'document_id'"
-            doc = docs_service.documents().get(documentId=document_id).execute()
+            doc = docs_service.documents().get(
+                documentId=document_id, fields=_READ_FIELDS
+            ).execute()
             content = doc.get("body", {}).get("content", [])
-            text_parts = []
-            for element in content:
-                if "paragraph" in element:
-                    for elem in element["paragraph"].get("elements", []):
-                        run = elem.get("textRun")
-                        if run:
-                            text_parts.append(run.get("content", ""))
-            full_text = "".join(text_parts)
+            # One pass over paragraphs -> elements -> text runs, straight into join
+            full_text = "".join(
+                run.get("content", "")
+                for element in content if "paragraph" in element
+                for elem in element["paragraph"].get("elements", ())
+                for run in (elem.get("textRun"),) if run
+            )
             return f"Title: {doc.get('title', 'Untitled')}\n\n{full_text}"
 
         elif action == "append_text":
             if not document_id or not text:
                 return "Error: Missing 'document_id' or 'text'"
-            # Get end index of document
-            doc = docs_service.documents().get(documentId=document_id).execute()
-            body_content = doc.get("body", {}).get("content", [])
-            end_index = 1
-            for element in body_content:
-                if "endIndex" in element:
-                    end_index = element["endIndex"]
+            # Docs resolves the end of the body server-side: no preflight GET for its index
             requests_body = [
-                {"insertText": {"location": {"index": end_index - 1}, "text": text}}
+                {"insertText": {"endOfSegmentLocation": {}, "text": text}}
             ]
-            docs_service.documents().batchUpdate(
-                documentId=document_id, body={"requests": requests_body}
-            ).execute()
+            _batch_update(docs_service, document_id, requests_body)
             return f"Text appended to document {document_id}."
 
         elif action == "insert_text":
@@ -90,9 +101,7 @@ def docs_act(
             requests_body = [
                 {"insertText": {"location": {"index": index}, "text": text}}
             ]
-            docs_service.documents().batchUpdate(
-                documentId=document_id, body={"requests": requests_body}
-            ).execute()
+            _batch_update(docs_service, document_id, requests_body)
             return f"Text inserted at index {index} in document {document_id}."
 
         elif action == "replace_text":
@@ -106,14 +115,30 @@ def docs_act(
                     }
                 }
             ]
-            result = docs_service.documents().batchUpdate(
-                documentId=document_id, body={"requests": requests_body}
-            ).execute()
+            result = _batch_update(docs_service, document_id, requests_body)
             count = 0
             for reply in result.get("replies", []):
                 count += reply.get("replaceAllText", {}).get("occurrencesChanged", 0)
             return f"Replaced {count} occurrences of '{find}' with '{replace}'."
 
+        elif action == "batch_edit":
+            if not document_id or not requests:
+                return "Error: Missing 'document_id' or 'requests'"
+            try:
+                requests_body = json.loads(requests)
+            except json.JSONDecodeError as e:
+                return f"Error: 'requests' is not valid JSON: {e}"
+            if not isinstance(requests_body, list) or not requests_body:
+                return "Error: 'requests' must be a non-empty JSON list"
+            result = _batch_update(docs_service, document_id, requests_body)
+            count = 0
+            for reply in result.get("replies", []):
+                count += (reply or {}).get("replaceAllText", {}).get("occurrencesChanged", 0)
+            msg = f"Applied {len(requests_body)} edit(s) to document {document_id}."
+            if count:
+                msg += f" Replaced {count} occurrence(s)."
+            return msg
+
         elif action == "list_docs":
             drive_service = _get_drive_service()
             results = drive_service.files().list(
@@ -133,5 +158,4 @@ def docs_act(
             return f"Error: Unknown action '{action}'"
 
     except Exception as e:
-        import traceback
         return f"Docs Error: {str(e)}\n{traceback.format_exc()}"
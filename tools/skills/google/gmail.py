@@ -4,6 +4,7 @@ Provides a single tool entry point `gmail_act` for managing Gmail.
 """
 
 import base64
+import traceback
 from email.mime.text import MIMEText
 from typing import Optional
 from langchain_core.tools import tool
@@ -14,6 +15,98 @@ def _get_gmail_service():
     return get_google_service("gmail", "v1")
 
 
+# Gmail accepts at most 100 calls per batch request
+_BATCH_LIMIT = 100
+_LIST_HEADERS = ["From", "Subject", "Date"]
+# The only headers any action reads; a full message carries dozens more
+_WANTED_HEADERS = frozenset(("From", "To", "Subject", "Date", "Message-ID"))
+
+# Single-request fallback: concurrent GETs (messages.get costs 5 of the 250 quota
+# units/sec) and retries with exponential backoff on 429/5xx
+_FALLBACK_WORKERS = 10
+_NUM_RETRIES = 5
+
+
+def _header_map(message: dict) -> dict:
+    """Returns {name: value} for the headers gmail_act uses, skipping the rest."""
+    return {
+        h["name"]: h["value"]
+        for h in message.get("payload", {}).get("headers", ())
+        if h["name"] in _WANTED_HEADERS
+    }
+
+
+def _get_list_headers(service, credentials, msg_id: str):
+    """Fetches one message's list headers as (response, error), on its own connection."""
+    import httplib2
+    import google_auth_httplib2
+    # httplib2 connections aren't thread-safe, so each call gets its own
+    http = google_auth_httplib2.AuthorizedHttp(credentials, http=httplib2.Http())
+    try:
+        response = service.users().messages().get(
+            userId="me", id=msg_id, format="metadata",
+            metadataHeaders=_LIST_HEADERS
+        ).execute(http=http, num_retries=_NUM_RETRIES)
+        return response, None
+    except Exception as e:
+        return None, e
+
+
+def _needs_refetch(result) -> bool:
+    """True for messages the batch didn't return, or that it rate limited (HTTP 429)."""
+    if result is None:
+        return True
+    error = result[1]
+    return getattr(getattr(error, "resp", None), "status", None) == 429
+
+
+def _fetch_list_headers(service, messages: list) -> list:
+    """
+    Fetches From/Subject/Date for each listed message using batch requests
+    (one HTTP round trip per 100 messages instead of one per message).
+    Messages the batch couldn't deliver are fetched individually in parallel.
+    Returns (headers dict, error) pairs in the order of `messages`.
+    """
+    results = {}
+
+    def _collect(request_id, response, exception):
+        results[request_id] = (response, exception)
+
+    try:
+        for start in range(0, len(messages), _BATCH_LIMIT):
+            batch = service.new_batch_http_request(callback=_collect)
+            for msg in messages[start:start + _BATCH_LIMIT]:
+                batch.add(
+                    service.users().messages().get(
+                        userId="me", id=msg["id"], format="metadata",
+                        metadataHeaders=_LIST_HEADERS
+                    ),
+                    request_id=msg["id"],
+                )
+            batch.execute()
+    except Exception:
+        pass  # Batch endpoint unavailable: whatever wasn't collected is refetched below
+
+    refetch = [msg["id"] for msg in messages if _needs_refetch(results.get(msg["id"]))]
+    if refetch:
+        from concurrent.futures import ThreadPoolExecutor
+        credentials = service._http.credentials  # The AuthorizedHttp built by get_google_service
+        with ThreadPoolExecutor(max_workers=min(_FALLBACK_WORKERS, len(refetch))) as pool:
+            outcomes = pool.map(lambda msg_id: _get_list_headers(service, credentials, msg_id), refetch)
+            for msg_id, outcome in zip(refetch, outcomes):
+                results[msg_id] = outcome
+
+    fetched = []
+    for msg in messages:
+        detail, error = results.get(msg["id"], (None, None))
+        if error is not None or detail is None:
+            fetched.append(({}, error or "no response"))
+            continue
+        headers = _header_map(detail)
+        fetched.append((headers, None))
+    return fetched
+
+
 @tool
 def gmail_act(
     action: str,
@@ -65,12 +158,10 @@ def gmail_act(
             if not messages:
                 return "No messages in inbox."
             output = []
-            for msg in messages:
-                detail = service.users().messages().get(
-                    userId="me", id=msg["id"], format="metadata",
-                    metadataHeaders=["From", "Subject", "Date"]
-                ).execute()
-                headers = {h["name"]: h["value"] for h in detail.get("payload", {}).get("headers", [])}
+            for msg, (headers, error) in zip(messages, _fetch_list_headers(service, messages)):
+                if error is not None:
+                    output.append(f"ID: {msg['id']} | Error: {error}")
+                    continue
                 output.append(
                     f"ID: {msg['id']} | From: {headers.get('From', 'N/A')} | "
                     f"Subject: {headers.get('Subject', 'N/A')} | Date: {headers.get('Date', 'N/A')}"
@@ -83,7 +174,7 @@ def gmail_act(
             msg = service.users().messages().get(
                 userId="me", id=message_id, format="full"
             ).execute()
-            headers = {h["name"]: h["value"] for h in msg.get("payload", {}).get("headers", [])}
+            headers = _header_map(msg)
             # Extract body
             body_text = ""
             payload = msg.get("payload", {})
@@ -111,7 +202,7 @@ def gmail_act(
                 userId="me", id=message_id, format="metadata",
                 metadataHeaders=["From", "Subject", "Message-ID"]
             ).execute()
-            headers = {h["name"]: h["value"] for h in original.get("payload", {}).get("headers", [])}
+            headers = _header_map(original)
             reply = MIMEText(body)
             reply["to"] = headers.get("From", "")
             reply["subject"] = "Re: " + headers.get("Subject", "")
@@ -134,12 +225,10 @@ def gmail_act(
             if not messages:
                 return f"No messages found for query: {query}"
             output = []
-            for msg in messages:
-                detail = service.users().messages().get(
-                    userId="me", id=msg["id"], format="metadata",
-                    metadataHeaders=["From", "Subject", "Date"]
-                ).execute()
-                headers = {h["name"]: h["value"] for h in detail.get("payload", {}).get("headers", [])}
+            for msg, (headers, error) in zip(messages, _fetch_list_headers(service, messages)):
+                if error is not None:
+                    output.append(f"ID: {msg['id']} | Error: {error}")
+                    continue
                 output.append(
                     f"ID: {msg['id']} | From: {headers.get('From', 'N/A')} | "
                     f"Subject: {headers.get('Subject', 'N/A')}"
@@ -179,5 +268,4 @@ def gmail_act(
             return f"Error: Unknown action '{action}'"
 
     except Exception as e:
-        import traceback
         return f"Gmail Error: {str(e)}\n{traceback.format_exc()}"
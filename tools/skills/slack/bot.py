@@ -1,9 +1,11 @@
 import logging
 import os
+import re
 import sys
 import json
 import asyncio
-from collections import deque
+import traceback
+from collections import deque, OrderedDict
 from dotenv import load_dotenv
 
 # Add root directory to sys.path to allow importing agent.py
@@ -16,6 +18,7 @@ from slack_bolt.adapter.socket_mode.async_handler import AsyncSocketModeHandler
 # Import agent logic
 from agent import app as agent_app
 from langchain_core.messages import HumanMessage
+from brain.llm_factory import get_llm
 
 # Load environment variables
 load_dotenv(os.path.join(ROOT_DIR, ".env"))
@@ -54,12 +57,130 @@ SLACK_BOT_TOKEN = slack_config.get("bot_token") or os.getenv("SLACK_BOT_TOKEN")
 SLACK_APP_TOKEN = slack_config.get("app_token") or os.getenv("SLACK_APP_TOKEN")
 SLACK_ALLOWED_USER_ID = slack_config.get("allowed_user_id") or os.getenv("SLACK_ALLOWED_USER_ID")
 
-# In-memory history for Channel context
-CHAT_HISTORY = {} # channel_id -> deque(maxlen=5)
+# In-memory history for Channel context, least recently active evicted first
+CHAT_HISTORY = OrderedDict() # channel_id / thread_ts -> deque(maxlen=5)
+MAX_HISTORY_CONTEXTS = 10_000
+
+# Cheap pre-filter ahead of the channel LLM classifier: acknowledgements, very short
+# messages and statements without any question/help cue are a NO without the LLM call
+CLASSIFIER_MIN_CHARS = 8
+CLASSIFIER_SKIP = frozenset((
+    "ok", "okay", "k", "lol", "lmao", "haha", "thanks", "thank you", "thx", "ty",
+    "yes", "no", "yep", "nope", "sure", "cool", "nice", "great", "+1", "👍", "🙏", "😂",
+))
+CLASSIFIER_CUE_RE = re.compile(
+    r"\?|\b(?:how|what|why|when|where|who|which|can|could|would|should|does|do|is|are"
+    r"|anyone|someone|help|please|explain|bot)\b",
+    re.IGNORECASE,
+)
+
+def _may_need_reply(text: str) -> bool:
+    """False for messages that clearly don't call for the bot, so the classifier can be skipped."""
+    stripped = text.strip()
+    if len(stripped) < CLASSIFIER_MIN_CHARS or stripped.lower() in CLASSIFIER_SKIP:
+        return False
+    return CLASSIFIER_CUE_RE.search(stripped) is not None
+
+CLASSIFIER_TEMPLATE = """
+You are a router for a helpful Slack Bot. You are silently reading a channel.
+Review the following recent conversation history:
+
+--- START HISTORY ---
+{history_text}
+--- END HISTORY ---
+
+Your ONLY job is to decide if you (the bot) should intervene and reply to the LAST message.
+Answer "YES" if:
+1. The user explicitly asked a generally helpful question directed at anyone (e.g. "Does anyone know how to...").
+2. The user asked a factual question or needs AI assistance.
+3. The user is talking directly to the bot without explicitly tagging it.
+
+Answer "NO" if:
+1. It is just two humans casually chatting with each other.
+2. It's a statement, greeting, or comment that doesn't demand a response.
+3. You are unsure. Err on the side of silence.
+
+Respond with exactly one word: "YES" or "NO".
+"""
+
+_CLASSIFIER_LLM = None
+
+def _get_classifier_llm():
+    """Chat model for the channel classifier (configured provider/model), built on first use."""
+    global _CLASSIFIER_LLM
+    if _CLASSIFIER_LLM is None:
+        _CLASSIFIER_LLM = get_llm(
+            slack_config.get("provider", "google"),
+            slack_config.get("model", "gemini-2.5-flash"),
+            temperature=0.0,
+        )
+    return _CLASSIFIER_LLM
 
+# Set once in main() (auth_test) before events are handled
 BOT_USER_ID = None
-USER_CACHE = {}
-CHANNEL_CACHE = {}
+BOT_MENTION = None  # "<@BOT_USER_ID>"
+# Display names by user / channel ID, least recently used evicted first
+USER_CACHE = OrderedDict()
+CHANNEL_CACHE = OrderedDict()
+MAX_CACHED_NAMES = 1000
+
+def _lru_get(cache, key):
+    """Returns cache[key] (marking it recently used), or None."""
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+def _lru_put(cache, key, value, maxsize):
+    """Stores cache[key] = value, evicting the least recently used entry past maxsize."""
+    cache[key] = value
+    cache.move_to_end(key)
+    if len(cache) > maxsize:
+        cache.popitem(last=False)
+
+# Lookups in progress by ID, so a burst of messages from a new user or channel
+# shares one users_info / conversations_info call instead of one each
+USER_INFLIGHT = {}
+CHANNEL_INFLIGHT = {}
+
+async def _cached_name(cache, inflight, key, fetch, fallback):
+    """
+    Returns the cached name for key. On a miss only the first caller runs fetch();
+    concurrent callers await the same task. Failed lookups cache `fallback`.
+    """
+    name = _lru_get(cache, key)
+    if name is not None:
+        return name
+    task = inflight.get(key)
+    if task is None:
+        async def _fetch():
+            try:
+                value = await fetch()
+            except Exception:
+                value = fallback
+            _lru_put(cache, key, value, MAX_CACHED_NAMES)
+            return value
+        task = asyncio.ensure_future(_fetch())
+        inflight[key] = task
+        task.add_done_callback(lambda _: inflight.pop(key, None))
+    # Shielded: one cancelled handler mustn't cancel the lookup the others are waiting on
+    return await asyncio.shield(task)
+
+async def _fetch_user_name(client, user_id):
+    user_info = await client.users_info(user=user_id)
+    return user_info["user"]["real_name"] or user_info["user"]["name"]
+
+async def _fetch_channel_name(client, channel_id):
+    channel_info = await client.conversations_info(channel=channel_id)
+    return channel_info["channel"]["name"]
+
+def _history(context_id):
+    """Returns the recent-messages deque for a channel or thread, creating it if needed."""
+    history = _lru_get(CHAT_HISTORY, context_id)
+    if history is None:
+        history = deque(maxlen=5)
+        _lru_put(CHAT_HISTORY, context_id, history, MAX_HISTORY_CONTEXTS)
+    return history
 
 # Initialize Slack App
 app = AsyncApp(token=SLACK_BOT_TOKEN)
@@ -93,74 +214,39 @@ async def handle_message_events(event, say, client):
             return
 
     # Fetch User Name for better context
-    if user_id not in USER_CACHE:
-        try:
-            user_info = await client.users_info(user=user_id)
-            USER_CACHE[user_id] = user_info["user"]["real_name"] or user_info["user"]["name"]
-        except:
-            USER_CACHE[user_id] = "Unknown User"
-    
-    user_name = USER_CACHE[user_id]
+    user_name = await _cached_name(
+        USER_CACHE, USER_INFLIGHT, user_id,
+        lambda: _fetch_user_name(client, user_id), "Unknown User"
+    )
 
     print(f"DEBUG: Processing message: {user_text[:20]}...")
 
     # 2. Gather history for context, isolating threads from main channel
     context_id = thread_ts if thread_ts else channel_id
     
-    if context_id not in CHAT_HISTORY:
-        CHAT_HISTORY[context_id] = deque(maxlen=5)
-    
-    CHAT_HISTORY[context_id].append(f"{user_name}: {user_text}")
-    history_text = "\n".join(CHAT_HISTORY[context_id])
+    history = _history(context_id)
+    history.append(f"{user_name}: {user_text}")
+    # Joined only once a path needs it: most channel messages stop at the pre-filter
+    history_text = None
 
     # 3. Intelligent Classifier for Channels
     should_intervene = False
     
-    # Fetch bot's own user ID to check for mentions
-    global BOT_USER_ID
-    if not BOT_USER_ID:
-        try:
-            auth_test = await client.auth_test()
-            BOT_USER_ID = auth_test["user_id"]
-        except:
-            pass
-
-    is_mentioned = BOT_USER_ID and f"<@{BOT_USER_ID}>" in user_text
+    # Bot's own mention tag, fetched once at startup
+    is_mentioned = BOT_MENTION is not None and BOT_MENTION in user_text
     
     if is_dm or is_mentioned:
         should_intervene = True
         print(f"DEBUG: Explicit interaction detected (DM/Mention). Intervening.")
+    elif not _may_need_reply(user_text):
+        print("DEBUG: Pre-filter decided: NO (Ignoring)")
     else:
         # Fast, raw LLM call to classify if we should respond
         try:
             print(f"DEBUG: Running intervention classifier on Slack channel message...")
-            classifier_prompt = f"""
-You are a router for a helpful Slack Bot. You are silently reading a channel.
-Review the following recent conversation history:
-
---- START HISTORY ---
-{history_text}
---- END HISTORY ---
-
-Your ONLY job is to decide if you (the bot) should intervene and reply to the LAST message.
-Answer "YES" if:
-1. The user explicitly asked a generally helpful question directed at anyone (e.g. "Does anyone know how to...").
-2. The user asked a factual question or needs AI assistance.
-3. The user is talking directly to the bot without explicitly tagging it.
-
-Answer "NO" if:
-1. It is just two humans casually chatting with each other.
-2. It's a statement, greeting, or comment that doesn't demand a response.
-3. You are unsure. Err on the side of silence.
-
-Respond with exactly one word: "YES" or "NO".
-"""
-            # Use the configured provider/model
-            provider = slack_config.get("provider", "google")
-            model_name = slack_config.get("model", "gemini-2.5-flash")
-            
-            from brain.llm_factory import get_llm
-            llm = get_llm(provider, model_name, temperature=0.0)
+            history_text = "\n".join(history)
+            classifier_prompt = CLASSIFIER_TEMPLATE.format(history_text=history_text)
+            llm = _get_classifier_llm()
             classification = await llm.ainvoke([HumanMessage(content=classifier_prompt)])
             
             decision = classification.content.strip().upper()
@@ -175,6 +261,8 @@ Respond with exactly one word: "YES" or "NO".
 
     if not should_intervene:
         return
+    if history_text is None:
+        history_text = "\n".join(history)
 
     # 4. Agent Context Generation
     owner_id_str = str(SLACK_ALLOWED_USER_ID) if SLACK_ALLOWED_USER_ID else "UNKNOWN"
@@ -184,13 +272,10 @@ Respond with exactly one word: "YES" or "NO".
     if is_dm:
         channel_name = "DM"
     else:
-        if channel_id not in CHANNEL_CACHE:
-            try:
-                channel_info = await client.conversations_info(channel=channel_id)
-                CHANNEL_CACHE[channel_id] = channel_info["channel"]["name"]
-            except:
-                CHANNEL_CACHE[channel_id] = "Unknown Channel"
-        channel_name = CHANNEL_CACHE[channel_id]
+        channel_name = await _cached_name(
+            CHANNEL_CACHE, CHANNEL_INFLIGHT, channel_id,
+            lambda: _fetch_channel_name(client, channel_id), "Unknown Channel"
+        )
 
     if is_dm and is_owner:
         # Personal Assistant Interface (Gateway Mode)
@@ -216,7 +301,6 @@ Respond with exactly one word: "YES" or "NO".
             # Formatting logic for multiple blocks
             if isinstance(response_text, str) and response_text.strip().startswith("["):
                 try:
-                    import json
                     content_list = json.loads(response_text)
                     if isinstance(content_list, list):
                         text_parts = []
@@ -246,15 +330,12 @@ Respond with exactly one word: "YES" or "NO".
             await say(text=str(response_text), thread_ts=thread_ts)
             
             # Inject Agent's own response into the history queue so the classifier doesn't lose context
-            if context_id not in CHAT_HISTORY:
-                CHAT_HISTORY[context_id] = deque(maxlen=5)
-            CHAT_HISTORY[context_id].append(f"Space Black Bot: {response_text}")
+            _history(context_id).append(f"Space Black Bot: {response_text}")
         else:
              print("ERROR: Agent returned empty result.")
              await say(text="⚠️ Error: Agent returned no response.", thread_ts=thread_ts)
 
     except Exception as e:
-        import traceback
         traceback.print_exc()
         error_msg = f"⚠️ Error processing request: {str(e)}"
         print(f"ERROR: {error_msg}")
@@ -273,6 +354,15 @@ async def main():
     else:
         print("⚠️ WARNING: SLACK_ALLOWED_USER_ID not set. All DMs will be blocked!")
 
+    # Resolve the bot's own user ID once, before any event can need it for mention checks
+    global BOT_USER_ID, BOT_MENTION
+    try:
+        auth_test = await app.client.auth_test()
+        BOT_USER_ID = auth_test["user_id"]
+        BOT_MENTION = f"<@{BOT_USER_ID}>"
+    except Exception as e:
+        logging.error(f"Slack auth_test failed, @mentions won't be detected: {e}")
+
     handler = AsyncSocketModeHandler(app, SLACK_APP_TOKEN)
     await handler.start_async()
 
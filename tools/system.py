@@ -1,25 +1,64 @@
 
 import os
-import shutil
+import re
+import mmap
+import threading
+import shlex
 import subprocess
-import datetime
+import collections
+import time
 from langchain_core.tools import tool
 from brain.llm_factory import get_llm
 from brain.memory_manager import (
-    load_config, read_file_safe, 
+    load_config, read_file_safe, atomic_write, run_io,
     BRAIN_DIR, SOUL_FILE, USER_FILE
 )
 
+# Safety filters for execute_terminal_command, compiled once at import
+FORBIDDEN_COMMANDS = ("rm", "mv", "dd", "at", "crontab")
+INTERACTIVE_COMMANDS = frozenset(("nano", "vim", "ssh", "python", "ipython"))
+# Forbidden commands as whole words in command position (also catches `rm\t`, `/bin/rm`,
+# `x; rm`, and quoted/escaped forms like `sh -c 'rm ...'`, `\rm`, `{rm,x}`), plus
+# discarding output to /dev/null and the classic fork bomb
+_FORBIDDEN_RE = re.compile(
+    r"(?:^|[\s;|&(`/'\"\\{,!])(" + "|".join(map(re.escape, FORBIDDEN_COMMANDS)) + r")"
+    r"(?=[\s'\";|&)`},]|$)"
+    r"|>\s*/dev/null"
+    r"|:\(\)\s*\{\s*:\|:&\s*\};:"
+)
+# Anything the shell would interpret (pipes, redirects, globs, expansions, chaining)
+_SHELL_SYNTAX_RE = re.compile(r"[|&;<>()$`\\*?\[\]{}~!#\n]")
+
+def _command_argv(command: str):
+    """
+    Tokenizes a plain command into argv so it can run without spawning /bin/sh.
+    Returns None when the command needs a shell (or we're not on POSIX).
+    """
+    if os.name != "posix" or _SHELL_SYNTAX_RE.search(command):
+        return None
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return None
+    # Leading VAR=value assignments are shell syntax too
+    if not argv or "=" in argv[0]:
+        return None
+    return argv
+
 @tool
-def reflect_and_evolve(insight: str):
+async def reflect_and_evolve(insight: str):
     """
     Updates the SOUL.md file with new personality traits or behavioral adaptations.
     """
     try:
-        current_soul = read_file_safe(SOUL_FILE)
-        
-        # Backup
-        shutil.copy(SOUL_FILE, os.path.join(BRAIN_DIR, "soul.bak"))
+        # File I/O runs on the brain-io pool so the event loop keeps serving other tool calls
+        current_soul = await run_io(read_file_safe, SOUL_FILE)
+        # read_file_safe returns "" on a missing/unreadable file; don't back that up over soul.bak
+        if not current_soul:
+            return "Error: SOUL.md is missing or empty. Evolution aborted to protect soul.bak."
+
+        # Backup (from the copy already in memory, no second read of SOUL.md)
+        await run_io(atomic_write, os.path.join(BRAIN_DIR, "soul.bak"), current_soul.encode("utf-8"))
 
         # LLM Call
         config = load_config()
@@ -38,7 +77,7 @@ def reflect_and_evolve(insight: str):
         3. The file MUST start with "# SOUL.md".
         4. Keep the original structure (Core Truths, Boundaries, Vibe).
         """
-        response = merger_llm.invoke(merge_prompt)
+        response = await merger_llm.ainvoke(merge_prompt)
         # Handle list return from invoke
         if isinstance(response, list):
              response = response[0]
@@ -50,8 +89,7 @@ def reflect_and_evolve(insight: str):
         if len(new_soul_content) < 100 or "# SOUL.md" not in new_soul_content:
              return f"Error: LLM returned invalid content. Evolution aborted to protect SOUL.md. Output: {new_soul_content[:50]}..."
 
-        with open(SOUL_FILE, "w") as f:
-            f.write(new_soul_content)
+        await run_io(atomic_write, SOUL_FILE, new_soul_content.encode("utf-8"))
             
         return "I have evolved. My new personality is set."
     except Exception as e:
@@ -65,41 +103,58 @@ def update_user_profile(key: str, value: str):
     Do NOT use for: Temporary chat context or random thoughts.
     """
     try:
-        current_content = read_file_safe(USER_FILE)
-        lines = current_content.split('\n')
-        new_lines = []
-        key_found = False
-        
-        # Standardize key format for search (e.g., "**Name:**")
-        search_str = f"**{key}:**"
-        
-        for line in lines:
-            if search_str in line:
-                new_lines.append(f"- **{key}:** {value}")
-                key_found = True
-            else:
-                new_lines.append(line)
-                
-        if not key_found:
-            new_lines.append(f"- **{key}:** {value}")
-            
-        with open(USER_FILE, "w") as f:
-            f.write("\n".join(new_lines))
+        marker = f"**{key}:**".encode("utf-8")
+        new_line = f"- **{key}:** {value}".encode("utf-8")
+
+        # Scan the mapped file for the key marker (e.g., "**Name:**") without
+        # decoding it or splitting it into a list of lines
+        try:
+            with open(USER_FILE, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                idx = mm.find(marker)
+                if idx >= 0:
+                    start = mm.rfind(b"\n", 0, idx) + 1
+                    end = mm.find(b"\n", idx)
+                    if end < 0:
+                        end = len(mm)
+                    # Idempotent update: skip the write when the value is unchanged
+                    if mm[start:end] == new_line:
+                        return f"Updated user profile: {key}={value}"
+                    new_content = mm[:start] + new_line + mm[end:]
+                else:
+                    new_content = mm[:].rstrip() + b"\n" + new_line
+        except (FileNotFoundError, ValueError):
+            # Missing or empty file (an empty file can't be mapped)
+            new_content = b"\n" + new_line
+
+        atomic_write(USER_FILE, new_content)
             
         return f"Updated user profile: {key}={value}"
     except Exception as e:
         return f"Failed to update profile: {str(e)}"
 
+# Serializes this process's memory log appends and the cleanup pass that follows them
+_MEMORY_LOCK = threading.Lock()
+_HAS_WRITEV = hasattr(os, "writev")  # POSIX only
+
+# Today's date and log path, recomputed only when the local day rolls over
+_TODAY = {"iso": None, "file": None, "end": 0.0}
+
+def _today_bucket(now: float):
+    """Returns (date_iso, memory_file) for the local day containing `now`."""
+    if now >= _TODAY["end"] or _TODAY["iso"] is None:
+        lt = time.localtime(now)
+        # Next local midnight (mktime normalizes day overflow and DST)
+        _TODAY["end"] = time.mktime((lt.tm_year, lt.tm_mon, lt.tm_mday + 1, 0, 0, 0, 0, 0, -1))
+        _TODAY["iso"] = time.strftime("%Y-%m-%d", lt)
+        _TODAY["file"] = os.path.join(BRAIN_DIR, "memory", f"{_TODAY['iso']}.md")
+    return _TODAY["iso"], _TODAY["file"]
+
 @tool
 def update_memory(content: str):
     """Logs to daily memory file."""
-    today = datetime.date.today().isoformat()
-    # Ensure memory directory exists
-    memory_dir = os.path.join(BRAIN_DIR, "memory")
-    os.makedirs(memory_dir, exist_ok=True)
-    
-    memory_file = os.path.join(memory_dir, f"{today}.md")
-    timestamp = datetime.datetime.now().strftime("%H:%M:%S")
+    now = time.time()
+    today, memory_file = _today_bucket(now)
+    timestamp = time.strftime("%H:%M:%S", time.localtime(now))
 
     try:
         # Deduplication Logic
@@ -114,17 +169,80 @@ def update_memory(content: str):
                          # Return success without writing to save space
                         return f"Logged to memory/{today}.md (Duplicate skipped)."
 
-        with open(memory_file, "a") as f:
-            f.write(f"[{timestamp}] {content}\n")
-            
-        # Post-write cleanup (optional but good for consistency)
-        from tools.memory_cleaner import clean_memory_file
-        clean_memory_file(memory_file)
-        
+        # ToolNode may run tool calls concurrently in worker threads
+        with _MEMORY_LOCK:
+            if not os.path.exists(memory_file):
+                # Ensure memory directory exists
+                os.makedirs(os.path.dirname(memory_file), exist_ok=True)
+            parts = (f"[{timestamp}] ".encode("utf-8"), content.encode("utf-8"), b"\n")
+            # Opened per call: the cleaner (in this or another process) may replace the file
+            fd = os.open(memory_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            try:
+                if _HAS_WRITEV:
+                    # One vectored O_APPEND write, no concatenated buffer
+                    os.writev(fd, parts)
+                else:
+                    os.write(fd, b"".join(parts))
+            finally:
+                os.close(fd)
+
+            # Post-write cleanup (optional but good for consistency)
+            from tools.memory_cleaner import clean_memory_file
+            clean_memory_file(memory_file)
+
         return f"Logged to memory/{today}.md."
     except Exception as e:
         return f"Failed to log: {str(e)}"
 
+# Limits for execute_terminal_command: wall-clock seconds and bytes of output kept (the tail)
+_COMMAND_TIMEOUT = 10
+_OUTPUT_MAX_BYTES = 256 * 1024
+_READ_CHUNK = 64 * 1024
+
+def _run_bounded(args, shell: bool) -> str:
+    """
+    Runs a command with stderr merged into stdout, keeping only the last
+    _OUTPUT_MAX_BYTES bytes so runaway output (e.g. `find /`, or one huge line)
+    can't exhaust memory.
+    Raises subprocess.TimeoutExpired (after killing it) if it runs too long.
+    """
+    proc = subprocess.Popen(args, shell=shell, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    tail = collections.deque()
+    held = [0]  # bytes currently in tail
+    lock = threading.Lock()
+
+    def drain():
+        fd = proc.stdout.fileno()
+        try:
+            # Fixed-size reads, so a single line with no newline is still bounded
+            for chunk in iter(lambda: os.read(fd, _READ_CHUNK), b""):
+                with lock:
+                    tail.append(chunk)
+                    held[0] += len(chunk)
+                    while held[0] - len(tail[0]) >= _OUTPUT_MAX_BYTES:
+                        held[0] -= len(tail.popleft())
+        finally:
+            # The reader owns the pipe: closing it from the caller while a read is
+            # in flight could hand the fd number to an unrelated open()
+            proc.stdout.close()
+
+    # Drain the pipe on a thread so the timeout below still applies (select() isn't portable to Windows pipes)
+    reader = threading.Thread(target=drain, daemon=True)
+    reader.start()
+    try:
+        proc.wait(timeout=_COMMAND_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise
+    finally:
+        # Background grandchildren may hold the pipe open; don't wait on them forever
+        reader.join(1)
+    # Snapshot under the lock: the reader may still be running if it timed out above
+    with lock:
+        data = b"".join(tail)
+    return data[-_OUTPUT_MAX_BYTES:].decode("utf-8", errors="replace")
+
 @tool
 def execute_terminal_command(command: str):
     """
@@ -137,18 +255,29 @@ def execute_terminal_command(command: str):
     - You should execute read-only commands (`grep`, `git status`) IMMEDIATELY without asking for permission.
     - Only ask for confirmation for destructive commands (`rm`, `mv`, `dd`).
     """
-    forbidden = ["rm ", "mv ", "dd ", "at ", "crontab", "> /dev/null", ":(){:|:&};:"]
-    for taboo in forbidden:
-        if taboo in command:
-            return f"SAFETY BLOCK: Command '{command}' contains dangerous operations ({taboo}). Ask for confirmation."
+    match = _FORBIDDEN_RE.search(command)
+    if match:
+        return f"SAFETY BLOCK: Command '{command}' contains dangerous operations ({match.group(1) or match.group(0)}). Ask for confirmation."
 
-    interactive = ["nano", "vim", "ssh", "python", "ipython"]
-    if command.split()[0] in interactive:
+    try:
+        head = shlex.split(command)[:1]
+    except ValueError:
+        head = command.split(None, 1)
+    if head and head[0] in INTERACTIVE_COMMANDS:
         return "Error: Interactive tools not supported."
 
     try:
-        result = subprocess.run(command, shell=True, capture_output=True, text=True, timeout=10)
-        output = result.stdout + result.stderr
+        output = None
+        argv = _command_argv(command)
+        if argv is not None:
+            try:
+                output = _run_bounded(argv, shell=False)
+            except OSError:
+                # Not directly runnable (a shell builtin like `cd`, not executable,
+                # a script without a shebang): let the shell run it or report the error
+                pass
+        if output is None:
+            output = _run_bounded(command, shell=True)
         return output if output.strip() else "(No output)"
     except Exception as e:
         return f"Execution failed: {str(e)}"
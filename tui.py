@@ -21,7 +21,7 @@ import os
 from brain.llm_factory import get_llm
 from brain.memory_manager import SOUL_FILE
 
-from agent import app as agent_app, CONFIG_FILE, ENV_FILE, run_autonomous_heartbeat, load_chat_history, save_chat_history, CHAT_HISTORY_FILE
+from agent import app as agent_app, CONFIG_FILE, ENV_FILE, run_autonomous_heartbeat, load_chat_history, save_chat_history, CHAT_HISTORY_FILE, reload_llm
 
 try:
     from tools.voice.recorder import record_audio
@@ -533,6 +533,9 @@ class ConfigScreen(ModalScreen):
              with open(ENV_FILE, "w") as f: f.writelines(lines)
              os.environ["BRAVE_API_KEY"] = brave_key
 
+        # Rebuild LLM clients on the next turn with the new key/settings
+        reload_llm()
+
         self.dismiss(result=True)
 
 
@@ -1004,9 +1007,8 @@ class TasksScreen(ModalScreen):
 
         tasks = []
         try:
-            from brain.memory_manager import SCHEDULE_FILE, read_file_safe
-            content = read_file_safe(SCHEDULE_FILE, "[]")
-            tasks = json.loads(content)
+            from brain.memory_manager import SCHEDULE_FILE, load_json_file
+            tasks = load_json_file(SCHEDULE_FILE, [])
         except Exception as e:
             tasks_list.mount(Label(f"Error loading tasks: {e}", classes="empty-msg"))
             return
@@ -1043,14 +1045,12 @@ class TasksScreen(ModalScreen):
                 self.notify(f"Error deleting task: {e}", severity="error")
 
     def delete_task(self, idx: int):
-        from brain.memory_manager import SCHEDULE_FILE, read_file_safe
+        from brain.memory_manager import SCHEDULE_FILE, load_json_file, save_json_file
         try:
-            content = read_file_safe(SCHEDULE_FILE, "[]")
-            tasks = json.loads(content)
+            tasks = load_json_file(SCHEDULE_FILE, [])
             if 0 <= idx < len(tasks):
                 tasks.pop(idx)
-                with open(SCHEDULE_FILE, "w") as f:
-                    json.dump(tasks, f, indent=4)
+                save_json_file(SCHEDULE_FILE, tasks)
                 self.notify("Deleted task.")
                 self.refresh_tasks()
             else:
@@ -1303,15 +1303,15 @@ class AgentInterface(App):
 
     # ── Heartbeat ──────────────────────────────────────────────────────────
 
-    @work(exclusive=True, thread=True, group="heartbeat")
-    def scheduled_heartbeat(self):
+    @work(exclusive=True, group="heartbeat")
+    async def scheduled_heartbeat(self):
         # NEVER call process_agent_response from here — it would cancel user's work
         if self._processing:
             return  # Don't disturb active agent work
         try:
-             result = run_autonomous_heartbeat()
+             result = await run_autonomous_heartbeat()
              if result:
-                 self.call_from_thread(self.display_system_alert, result)
+                 self.display_system_alert(result)
         except Exception:
             pass
 
@@ -1594,6 +1594,11 @@ class AgentInterface(App):
             self.call_from_thread(self.notify, f"Audio Error: {e}", severity="error")
 
 
-if __name__ == "__main__":
+def main():
+    """Runs the Ghost TUI in the current process."""
     app = AgentInterface()
     app.run()
+
+
+if __name__ == "__main__":
+    main()